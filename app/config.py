@@ -24,6 +24,10 @@ class Settings:
     openai_assistant_temperature: float = float(os.getenv("OPENAI_ASSISTANT_TEMPERATURE", "0.05"))
     openai_assistant_timeout_seconds: float = float(os.getenv("OPENAI_ASSISTANT_TIMEOUT_SECONDS", "14"))
     openai_timeout_seconds: float = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "12"))
+    openai_response_cache_seconds: float = float(os.getenv("OPENAI_RESPONSE_CACHE_SECONDS", "300"))
+    openai_hedge_delay_seconds: float = float(os.getenv("OPENAI_HEDGE_DELAY_SECONDS", "4.0"))
+    openai_extraction_max_prompt_tokens: int = int(os.getenv("OPENAI_EXTRACTION_MAX_PROMPT_TOKENS", "6000"))
+    openai_max_input_tokens: int = int(os.getenv("OPENAI_MAX_INPUT_TOKENS", "120000"))
     assistant_llm_only: bool = os.getenv("ASSISTANT_LLM_ONLY", "true").strip().lower() in {
         "1",
         "true",
@@ -11,6 +11,7 @@ from app.config import settings
 from app.db import Base, engine
 from app.routers import assistant, approvals, briefing, calendar, graph, health, meetings, nli, profile, projects, scheduling, sync, tasks
 from app.services.core import ensure_profile
+from app.services.openai_client import warm_up_openai_parsers
 from app.services.sync_worker import start_sync_worker, stop_sync_worker
 from app.db import SessionLocal
 
@@ -48,6 +49,7 @@ def on_startup() -> None:
     Base.metadata.create_all(bind=engine)
     with SessionLocal() as db:
         ensure_profile(db)
+    warm_up_openai_parsers()
     start_sync_worker()
 
 
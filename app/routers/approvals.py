@@ -6,7 +6,7 @@ from zoneinfo import ZoneInfo
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.config import settings
 from app.db import engine, get_db
@@ -169,7 +169,7 @@ def resolve_approval(approval_id: str, payload: ApprovalResolve, db: Session = D
 
     if approval.type == "reschedule" and decision == "approve":
         proposal_id = approval.payload.get("proposal_id")
-        proposal = db.get(SchedulingProposal, proposal_id)
+        proposal = db.get(SchedulingProposal, proposal_id, options=[selectinload(SchedulingProposal.changes)])
         if proposal and proposal.status == "draft":
             created_blocks, updated_blocks = apply_proposal(db, proposal)
             queued_calendar_blocks.extend([*created_blocks, *updated_blocks])
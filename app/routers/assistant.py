@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.config import settings
 from app.db import SessionLocal, engine, get_db
@@ -3341,7 +3341,7 @@ def _resolve_pending_approval_by_chat(
 
     if approval.type == "reschedule":
         proposal_id = approval.payload.get("proposal_id")
-        proposal = db.get(SchedulingProposal, proposal_id)
+        proposal = db.get(SchedulingProposal, proposal_id, options=[selectinload(SchedulingProposal.changes)])
         if proposal and proposal.status == "draft":
             created_blocks, updated_blocks = apply_proposal(db, proposal)
             changed_blocks = [*created_blocks, *updated_blocks]
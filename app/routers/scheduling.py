@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.db import get_db
 from app.models import ApprovalRequest, SchedulingProposal
@@ -66,7 +66,7 @@ def create_proposals(payload: SchedulingProposalRequest, db: Session = Depends(g
 
 @router.get("/proposals/{proposal_id}", response_model=ScheduleProposalOut)
 def get_proposal(proposal_id: str, db: Session = Depends(get_db)) -> ScheduleProposalOut:
-    proposal = db.get(SchedulingProposal, proposal_id)
+    proposal = db.get(SchedulingProposal, proposal_id, options=[selectinload(SchedulingProposal.changes)])
     if proposal is None:
         raise HTTPException(status_code=404, detail="Proposal not found")
     return ScheduleProposalOut.model_validate(proposal)
@@ -78,7 +78,7 @@ def apply_schedule_proposal(
     payload: ApplyProposalRequest,
     db: Session = Depends(get_db),
 ) -> dict:
-    proposal = db.get(SchedulingProposal, proposal_id)
+    proposal = db.get(SchedulingProposal, proposal_id, options=[selectinload(SchedulingProposal.changes)])
     if proposal is None:
         raise HTTPException(status_code=404, detail="Proposal not found")
 
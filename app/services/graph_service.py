@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 import re
 import threading
 from uuid import uuid4
@@ -11,9 +13,11 @@ from zoneinfo import ZoneInfo
 import dateparser
 import httpx
 from msal import ConfidentialClientApplication, SerializableTokenCache
-from sqlalchemy import and_, select
+import orjson
+from sqlalchemy import and_, select, update
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.config import settings
 from app.db import SessionLocal, engine
@@ -42,8 +46,12 @@ OUTBOX_CALENDAR_DELTA = "calendar.delta"
 OUTBOX_TODO_EXPORT = "todo.export"
 OUTBOX_TODO_DELTA = "todo.delta"
 OUTBOX_MAIL_DELTA = "mail.delta"
+GRAPH_MAX_CONCURRENCY = 8
+# Keeps IN (...) lookups under SQLite's bound-parameter limit (999 on older builds).
+_IMPORT_LOOKUP_CHUNK = 500
 _GRAPH_HTTP_CLIENT: httpx.Client | None = None
 _GRAPH_HTTP_CLIENT_LOCK = threading.Lock()
+_MSAL_LOCAL = threading.local()
 
 
 class GraphConfigError(RuntimeError):
@@ -68,13 +76,21 @@ class GraphAuthResult:
 
 
 
-def configured_scopes() -> list[str]:
-    return [scope.strip() for scope in settings.ms_scopes.split() if scope.strip()]
+@lru_cache(maxsize=4)
+def _local_tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
 
 
-def graph_scopes() -> list[str]:
-    scopes = [scope for scope in configured_scopes() if scope.lower() not in MSAL_RESERVED_SCOPES]
-    return scopes or ["User.Read"]
+# settings is frozen, so the config-derived helpers below are computed once per process.
+@lru_cache(maxsize=1)
+def configured_scopes() -> tuple[str, ...]:
+    return tuple(scope.strip() for scope in settings.ms_scopes.split() if scope.strip())
+
+
+@lru_cache(maxsize=1)
+def graph_scopes() -> tuple[str, ...]:
+    scopes = tuple(scope for scope in configured_scopes() if scope.lower() not in MSAL_RESERVED_SCOPES)
+    return scopes or ("User.Read",)
 
 
 def _scope_enabled(scope_prefix: str) -> bool:
@@ -85,7 +101,8 @@ def _scope_enabled(scope_prefix: str) -> bool:
 
 
 
-def _missing_settings() -> list[str]:
+@lru_cache(maxsize=1)
+def _missing_settings() -> tuple[str, ...]:
     missing: list[str] = []
     if not settings.ms_client_id:
         missing.append("MS_CLIENT_ID")
@@ -93,7 +110,7 @@ def _missing_settings() -> list[str]:
         missing.append("MS_CLIENT_SECRET")
     if not settings.ms_redirect_uri:
         missing.append("MS_REDIRECT_URI")
-    return missing
+    return tuple(missing)
 
 
 
@@ -313,7 +330,7 @@ def _parse_time_only(raw: str, base_dt: datetime) -> datetime | None:
             minute = 30
         if "오후" in m.group(0) and hour < 12:
             hour += 12
-        local = base_dt.astimezone(ZoneInfo(settings.timezone))
+        local = base_dt.astimezone(_local_tz(settings.timezone))
         parsed = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
         if parsed <= local:
             parsed = parsed + timedelta(days=1)
@@ -330,7 +347,7 @@ def _parse_time_only(raw: str, base_dt: datetime) -> datetime | None:
     if ampm in {"am", "a.m", "a.m."} and hour == 12:
         hour = 0
 
-    local = base_dt.astimezone(ZoneInfo(settings.timezone))
+    local = base_dt.astimezone(_local_tz(settings.timezone))
     parsed = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
     if parsed <= local:
         parsed = parsed + timedelta(days=1)
@@ -375,7 +392,7 @@ def _parse_month_day_with_time(raw: str, base_dt: datetime) -> datetime | None:
     if not (0 <= hour <= 23 and 0 <= minute <= 59):
         return None
 
-    tz = ZoneInfo(settings.timezone)
+    tz = _local_tz(settings.timezone)
     local_base = base_dt.astimezone(tz)
     try:
         target = datetime(
@@ -432,7 +449,7 @@ def _parse_loose_datetime(
         languages=["ko", "en"],
         settings={
             "PREFER_DATES_FROM": "future",
-            "RELATIVE_BASE": base_dt.astimezone(ZoneInfo(settings.timezone)),
+            "RELATIVE_BASE": base_dt.astimezone(_local_tz(settings.timezone)),
             "TIMEZONE": settings.timezone,
             "RETURN_AS_TIMEZONE_AWARE": True,
         },
@@ -452,7 +469,7 @@ def _parse_loose_datetime(
         return None
 
     if guessed.tzinfo is None:
-        return guessed.replace(tzinfo=ZoneInfo(settings.timezone)).astimezone(UTC)
+        return guessed.replace(tzinfo=_local_tz(settings.timezone)).astimezone(UTC)
     return guessed.astimezone(UTC)
 
 
@@ -738,6 +755,8 @@ def _update_sync_status(
     connected: bool | None = None,
     ping_success: bool = False,
     throttled: bool = False,
+    throttle_count: int = 1,
+    defer_commit: bool = False,
 ) -> None:
     row = _ensure_sync_status(db)
     now = datetime.now(UTC)
@@ -754,10 +773,10 @@ def _update_sync_status(
             changed = True
     if throttled:
         row.last_429_at = now
-        row.recent_429_count += 1
+        row.recent_429_count += max(1, throttle_count)
         changed = True
 
-    if changed:
+    if changed and not defer_commit:
         db.commit()
 
 
@@ -770,7 +789,9 @@ def _graph_http_client() -> httpx.Client:
         if _GRAPH_HTTP_CLIENT is None:
             _GRAPH_HTTP_CLIENT = httpx.Client(
                 http2=True,
-                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                # Keep idle HTTP/2 connections around between sync cycles so concurrent
+                # calls multiplex over one warm TLS session instead of re-handshaking.
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=300.0),
                 timeout=httpx.Timeout(connect=5.0, read=10.0, write=12.0, pool=5.0),
             )
     return _GRAPH_HTTP_CLIENT
@@ -800,36 +821,52 @@ def ensure_graph_connection(db: Session) -> GraphConnection:
 
 
 
-def _token_cache(row: GraphConnection) -> SerializableTokenCache:
-    cache = SerializableTokenCache()
-    if row.token_cache:
-        try:
-            cache.deserialize(row.token_cache)
-        except Exception:  # noqa: BLE001
-            cache = SerializableTokenCache()
-    return cache
+def _load_token_cache(cache: SerializableTokenCache, serialized: str | None) -> None:
+    try:
+        cache.deserialize(serialized or None)
+    except Exception:  # noqa: BLE001
+        cache.deserialize(None)
 
 
 
-def _msal_app(cache: SerializableTokenCache) -> ConfidentialClientApplication:
-    authority = f"https://login.microsoftonline.com/{settings.ms_tenant_id or 'common'}"
-    return ConfidentialClientApplication(
-        client_id=settings.ms_client_id,
-        client_credential=settings.ms_client_secret,
-        authority=authority,
-        token_cache=cache,
-    )
+def _store_token_cache(row: GraphConnection, cache: SerializableTokenCache) -> bool:
+    if not cache.has_state_changed:
+        return False
+    serialized = cache.serialize()
+    if serialized == row.token_cache:
+        return False
+    row.token_cache = serialized
+    return True
+
+
+
+def _msal_app(row: GraphConnection) -> tuple[ConfidentialClientApplication, SerializableTokenCache]:
+    """Return this thread's MSAL app with its token cache reloaded from the row."""
+    # MSAL binds refresh-token callbacks to the cache object at construction,
+    # so each thread keeps one app + cache pair and reloads the cache in place.
+    app = getattr(_MSAL_LOCAL, "app", None)
+    if app is None:
+        authority = f"https://login.microsoftonline.com/{settings.ms_tenant_id or 'common'}"
+        app = ConfidentialClientApplication(
+            client_id=settings.ms_client_id,
+            client_credential=settings.ms_client_secret,
+            authority=authority,
+            token_cache=SerializableTokenCache(),
+        )
+        _MSAL_LOCAL.app = app
+    cache = app.token_cache
+    _load_token_cache(cache, row.token_cache)
+    return app, cache
 
 
 
 def create_auth_url(db: Session) -> GraphAuthResult:
     missing = _missing_settings()
     if missing:
-        return GraphAuthResult(configured=False, auth_url=None, missing_settings=missing)
+        return GraphAuthResult(configured=False, auth_url=None, missing_settings=list(missing))
 
     row = ensure_graph_connection(db)
-    cache = _token_cache(row)
-    app = _msal_app(cache)
+    app, cache = _msal_app(row)
 
     state = uuid4().hex
     url = app.get_authorization_request_url(
@@ -840,9 +877,9 @@ def create_auth_url(db: Session) -> GraphAuthResult:
     )
 
     row.pending_state = state
-    row.scopes = settings.ms_scopes
-    if cache.has_state_changed:
-        row.token_cache = cache.serialize()
+    if row.scopes != settings.ms_scopes:
+        row.scopes = settings.ms_scopes
+    _store_token_cache(row, cache)
     db.commit()
 
     return GraphAuthResult(configured=True, auth_url=url, missing_settings=[])
@@ -858,8 +895,7 @@ def complete_auth_code(db: Session, code: str, state: str) -> dict:
     if not row.pending_state or row.pending_state != state:
         raise GraphAuthError("Invalid OAuth state. Please start sign-in again.")
 
-    cache = _token_cache(row)
-    app = _msal_app(cache)
+    app, cache = _msal_app(row)
 
     result = app.acquire_token_by_authorization_code(
         code=code,
@@ -882,8 +918,7 @@ def complete_auth_code(db: Session, code: str, state: str) -> dict:
     row.tenant_id = claims.get("tid") or settings.ms_tenant_id
     row.home_account_id = home_account_id
     row.scopes = settings.ms_scopes
-    if cache.has_state_changed:
-        row.token_cache = cache.serialize()
+    _store_token_cache(row, cache)
 
     db.commit()
     _update_sync_status(db, connected=True, ping_success=True)
@@ -892,7 +927,7 @@ def complete_auth_code(db: Session, code: str, state: str) -> dict:
         "connected": True,
         "username": row.username,
         "tenant_id": row.tenant_id,
-        "scopes": graph_scopes(),
+        "scopes": list(graph_scopes()),
     }
 
 
@@ -917,8 +952,7 @@ def _acquire_access_token(db: Session, *, force_refresh: bool = False) -> str:
     if not row.connected:
         raise GraphAuthError("Microsoft account is not connected.")
 
-    cache = _token_cache(row)
-    app = _msal_app(cache)
+    app, cache = _msal_app(row)
 
     accounts = app.get_accounts(username=row.username) or app.get_accounts()
     if not accounts:
@@ -939,16 +973,59 @@ def _acquire_access_token(db: Session, *, force_refresh: bool = False) -> str:
             description = result.get("error_description") or result.get("error") or description
         raise GraphAuthError(description)
 
-    row.connected = True
-    row.username = row.username or account.get("username")
-    if cache.has_state_changed:
-        row.token_cache = cache.serialize()
-    db.commit()
+    # Steady-state silent acquisition changes nothing; skip the COMMIT (and fsync) then.
+    changed = False
+    if not row.username and account.get("username"):
+        row.username = account.get("username")
+        changed = True
+    if _store_token_cache(row, cache):
+        changed = True
+    if changed:
+        db.commit()
 
     return result["access_token"]
 
 
 
+def _graph_url(path: str) -> str:
+    return path if path.startswith("http://") or path.startswith("https://") else f"{GRAPH_BASE_URL}{path}"
+
+
+def _graph_retry_after_seconds(response: httpx.Response) -> int:
+    try:
+        retry_after = int(response.headers.get("Retry-After", "2"))
+    except ValueError:
+        retry_after = 2
+    return min(max(retry_after, 1), 4)
+
+
+def _json_loads(data: bytes):
+    return orjson.loads(data)
+
+
+def _json_content(json_body: dict | None) -> bytes | None:
+    if json_body is None:
+        return None
+    return orjson.dumps(json_body)
+
+
+def _graph_error(response: httpx.Response) -> GraphApiError:
+    try:
+        payload = _json_loads(response.content)
+    except Exception:  # noqa: BLE001
+        payload = {"error": response.text}
+    return GraphApiError(response.status_code, str(payload))
+
+
+def _graph_response_payload(response: httpx.Response) -> dict:
+    if response.status_code == 204 or not response.content:
+        return {}
+    try:
+        return _json_loads(response.content)
+    except Exception:  # noqa: BLE001
+        return {}
+
+
 def graph_request(
     db: Session,
     method: str,
@@ -957,6 +1034,7 @@ def graph_request(
     params: dict | None = None,
     json_body: dict | None = None,
     headers: dict | None = None,
+    defer_commit: bool = False,
 ) -> dict:
     token = _acquire_access_token(db)
     attempts = 0
@@ -970,12 +1048,12 @@ def graph_request(
         if headers:
             request_headers.update(headers)
 
-        url = path if path.startswith("http://") or path.startswith("https://") else f"{GRAPH_BASE_URL}{path}"
+        url = _graph_url(path)
         response = _graph_http_client().request(
             method=method,
             url=url,
             params=params,
-            json=json_body,
+            content=_json_content(json_body),
             headers=request_headers,
             timeout=_graph_request_timeout(method, url),
         )
@@ -985,34 +1063,100 @@ def graph_request(
             continue
 
         if response.status_code == 429:
-            _update_sync_status(db, connected=True, throttled=True)
-            retry_after = 2
-            try:
-                retry_after = int(response.headers.get("Retry-After", "2"))
-            except ValueError:
-                retry_after = 2
-            time.sleep(min(max(retry_after, 1), 4))
+            _update_sync_status(db, connected=True, throttled=True, defer_commit=defer_commit)
+            time.sleep(_graph_retry_after_seconds(response))
             continue
 
         if response.status_code >= 400:
             _update_sync_status(db, connected=False if response.status_code in (401, 403) else None)
-            try:
-                payload = response.json()
-            except Exception:  # noqa: BLE001
-                payload = {"error": response.text}
-            raise GraphApiError(response.status_code, str(payload))
+            raise _graph_error(response)
+
+        _update_sync_status(db, connected=True, ping_success=True, defer_commit=defer_commit)
+        return _graph_response_payload(response)
 
-        _update_sync_status(db, connected=True, ping_success=True)
+    raise GraphApiError(429, "Graph request failed repeatedly due to throttling")
 
-        if response.status_code == 204 or not response.content:
-            return {}
 
+def _graph_request_many(
+    db: Session,
+    calls: list[tuple[str, str, dict | None]],
+    *,
+    defer_commit: bool = False,
+) -> list[dict | GraphApiError]:
+    """Run independent Graph calls concurrently; results keep call order and errors are returned."""
+    if not calls:
+        return []
+
+    token = _acquire_access_token(db)
+    client = _graph_http_client()
+    request_headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+
+    def send(call: tuple[str, str, dict | None]) -> tuple[httpx.Response | GraphApiError | None, int]:
+        method, path, json_body = call
+        throttled = 0
         try:
-            return response.json()
-        except Exception:  # noqa: BLE001
-            return {}
+            url = _graph_url(path)
+            for _ in range(4):
+                response = client.request(
+                    method=method,
+                    url=url,
+                    content=_json_content(json_body),
+                    headers=request_headers,
+                    timeout=_graph_request_timeout(method, url),
+                )
+                if response.status_code != 429:
+                    return response, throttled
+                throttled += 1
+                time.sleep(_graph_retry_after_seconds(response))
+        except Exception as exc:  # noqa: BLE001
+            # Returned, not raised: pool.map would otherwise drop results of calls that already succeeded.
+            return GraphApiError(503, f"Graph request failed: {exc}"), throttled
+        return None, throttled
+
+    # Workers only talk HTTP; the session is used from this thread only.
+    with ThreadPoolExecutor(max_workers=min(GRAPH_MAX_CONCURRENCY, len(calls))) as pool:
+        responses = list(pool.map(send, calls))
+
+    results: list[dict | GraphApiError] = []
+    throttled_total = 0
+    succeeded = False
+    auth_failed = False
+    for (method, path, json_body), (response, throttled) in zip(calls, responses):
+        throttled_total += throttled
+        if response is None:
+            results.append(GraphApiError(429, "Graph request failed repeatedly due to throttling"))
+            continue
+        if isinstance(response, GraphApiError):
+            results.append(response)
+            continue
+        if response.status_code == 401:
+            # Token expired mid-batch: the sequential path refreshes it and retries.
+            try:
+                results.append(graph_request(db, method, path, json_body=json_body))
+            except GraphApiError as exc:
+                results.append(exc)
+            except Exception as exc:  # noqa: BLE001
+                results.append(GraphApiError(503, f"Graph request failed: {exc}"))
+            continue
+        if response.status_code >= 400:
+            auth_failed = auth_failed or response.status_code == 403
+            results.append(_graph_error(response))
+            continue
+        succeeded = True
+        results.append(_graph_response_payload(response))
 
-    raise GraphApiError(429, "Graph request failed repeatedly due to throttling")
+    if throttled_total:
+        _update_sync_status(
+            db, connected=True, throttled=True, throttle_count=throttled_total, defer_commit=defer_commit
+        )
+    if succeeded:
+        _update_sync_status(db, connected=True, ping_success=True, defer_commit=defer_commit)
+    elif auth_failed:
+        _update_sync_status(db, connected=False, defer_commit=defer_commit)
+    return results
 
 
 
@@ -1026,7 +1170,7 @@ def parse_graph_datetime(value: str | None) -> datetime | None:
     except ValueError:
         return None
 
-    tz = ZoneInfo(settings.timezone)
+    tz = _local_tz(settings.timezone)
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=tz)
     return parsed.astimezone(tz)
@@ -1034,7 +1178,7 @@ def parse_graph_datetime(value: str | None) -> datetime | None:
 
 
 def format_graph_datetime(dt: datetime) -> dict:
-    tz = ZoneInfo(settings.timezone)
+    tz = _local_tz(settings.timezone)
     value = dt.astimezone(tz) if dt.tzinfo else dt.replace(tzinfo=tz)
     return {
         "dateTime": value.replace(tzinfo=None).strftime("%Y-%m-%dT%H:%M:%S"),
@@ -1050,8 +1194,8 @@ def status_payload(db: Session) -> dict:
         "connected": row.connected,
         "username": row.username,
         "tenant_id": row.tenant_id,
-        "scopes": configured_scopes(),
-        "missing_settings": _missing_settings(),
+        "scopes": list(configured_scopes()),
+        "missing_settings": list(_missing_settings()),
         "redirect_uri": settings.ms_redirect_uri,
     }
 
@@ -1392,14 +1536,21 @@ def ping_me(db: Session) -> dict:
 
 
 
-def list_calendar_events(db: Session, start: datetime, end: datetime, *, max_pages: int = 80) -> list[dict]:
+def list_calendar_events(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    *,
+    max_pages: int = 80,
+    defer_commit: bool = False,
+) -> list[dict]:
     if end <= start:
         raise GraphApiError(422, "end must be later than start")
 
     params = {
         "startDateTime": start.astimezone(UTC).isoformat(),
         "endDateTime": end.astimezone(UTC).isoformat(),
-        "$top": 80,
+        "$top": 999,
         "$orderby": "start/dateTime",
     }
     path = "/me/calendar/calendarView"
@@ -1413,6 +1564,7 @@ def list_calendar_events(db: Session, start: datetime, end: datetime, *, max_pag
             path,
             params=params,
             headers={"Prefer": f'outlook.timezone="{settings.timezone}"'},
+            defer_commit=defer_commit,
         )
         data.extend(payload.get("value", []))
 
@@ -1443,22 +1595,23 @@ def delete_blocks_from_outlook(db: Session, blocks: list[CalendarBlock]) -> dict
     skipped = 0
     failed = 0
 
+    linked: list[CalendarBlock] = []
     for block in blocks:
-        event_id = (block.outlook_event_id or "").strip()
-        if not event_id:
+        if (block.outlook_event_id or "").strip():
+            linked.append(block)
+        else:
             skipped += 1
-            continue
-
-        try:
-            delete_calendar_event(db, event_id)
-            deleted += 1
-        except GraphApiError as exc:
-            if exc.status_code == 404:
-                deleted += 1
-            else:
-                failed += 1
-                continue
 
+    results = _graph_request_many(
+        db,
+        [("DELETE", f"/me/events/{block.outlook_event_id.strip()}", None) for block in linked],
+        defer_commit=True,
+    )
+    for block, result in zip(linked, results):
+        if isinstance(result, GraphApiError) and result.status_code != 404:
+            failed += 1
+            continue
+        deleted += 1
         block.outlook_event_id = None
 
     db.commit()
@@ -1492,38 +1645,65 @@ def sync_blocks_to_outlook(db: Session, blocks: list[CalendarBlock]) -> dict:
     skipped = 0
     synced = 0
 
+    pending: list[tuple[CalendarBlock, dict]] = []
     for block in blocks:
         if block.source == "external":
             skipped += 1
             continue
-
-        payload = _block_event_payload(block)
-
-        if block.outlook_event_id:
-            try:
-                graph_request(db, "PATCH", f"/me/events/{block.outlook_event_id}", json_body=payload)
-                updated += 1
-                synced += 1
+        pending.append((block, _block_event_payload(block)))
+
+    linked = [(block, payload) for block, payload in pending if block.outlook_event_id]
+    to_create = [(block, payload) for block, payload in pending if not block.outlook_event_id]
+
+    # Remaining blocks are still synced when one call fails, so event ids that
+    # Outlook already accepted get committed before the first error is raised.
+    first_error: GraphApiError | None = None
+    event_ids: dict[str, str | None] = {}
+    results = _graph_request_many(
+        db,
+        [("PATCH", f"/me/events/{block.outlook_event_id}", payload) for block, payload in linked],
+        defer_commit=True,
+    )
+    for (block, payload), result in zip(linked, results):
+        if isinstance(result, GraphApiError):
+            if result.status_code != 404:
+                first_error = first_error or result
                 continue
-            except GraphApiError as exc:
-                if exc.status_code != 404:
-                    raise
-                block.outlook_event_id = None
-
-        create_payload = {
-            **payload,
-            "transactionId": f"aawo-block-{block.id}",
-        }
-        event = create_calendar_event(db, create_payload)
+            event_ids[block.id] = None
+            to_create.append((block, payload))
+            continue
+        updated += 1
+        synced += 1
+
+    # Payloads are fresh per block and not read again once sent, so tag them in place.
+    for block, payload in to_create:
+        payload["transactionId"] = f"aawo-block-{block.id}"
+    create_calls = [("POST", "/me/events", payload) for _, payload in to_create]
+    for (block, _), event in zip(to_create, _graph_request_many(db, create_calls, defer_commit=True)):
+        if isinstance(event, GraphApiError):
+            first_error = first_error or event
+            continue
         event_id = event.get("id")
         if event_id:
-            block.outlook_event_id = event_id
+            event_ids[block.id] = event_id
             created += 1
             synced += 1
         else:
             skipped += 1
 
+    # One executemany UPDATE by primary key instead of a unit-of-work flush;
+    # the loaded blocks are patched without being marked dirty again.
+    if event_ids:
+        db.execute(
+            update(CalendarBlock),
+            [{"id": block_id, "outlook_event_id": event_id} for block_id, event_id in event_ids.items()],
+        )
+        for block, _ in pending:
+            if block.id in event_ids:
+                set_committed_value(block, "outlook_event_id", event_ids[block.id])
     db.commit()
+    if first_error is not None:
+        raise first_error
     return {
         "blocks": len(blocks),
         "synced": synced,
@@ -1535,7 +1715,19 @@ def sync_blocks_to_outlook(db: Session, blocks: list[CalendarBlock]) -> dict:
 
 def export_calendar_to_outlook(db: Session, start: datetime, end: datetime) -> dict:
     rows = db.execute(
-        select(CalendarBlock).where(
+        select(CalendarBlock)
+        .options(
+            load_only(
+                CalendarBlock.id,
+                CalendarBlock.title,
+                CalendarBlock.start,
+                CalendarBlock.end,
+                CalendarBlock.source,
+                CalendarBlock.task_id,
+                CalendarBlock.outlook_event_id,
+            )
+        )
+        .where(
             and_(
                 CalendarBlock.start < end,
                 CalendarBlock.end > start,
@@ -2350,9 +2542,19 @@ def sync_mail_delta_to_local(
 
 
 def import_calendar_to_local(db: Session, start: datetime, end: datetime) -> dict:
-    events = list_calendar_events(db, start, end)
+    events = list_calendar_events(db, start, end, defer_commit=True)
     imported = 0
 
+    event_ids = [event["id"] for event in events if event.get("id")]
+    existing: dict[str, CalendarBlock] = {}
+    for offset in range(0, len(event_ids), _IMPORT_LOOKUP_CHUNK):
+        chunk = event_ids[offset : offset + _IMPORT_LOOKUP_CHUNK]
+        for row in db.execute(
+            select(CalendarBlock).where(CalendarBlock.outlook_event_id.in_(chunk))
+        ).scalars():
+            existing.setdefault(row.outlook_event_id, row)
+    new_rows: list[CalendarBlock] = []
+
     for event in events:
         event_id = event.get("id")
         if not event_id:
@@ -2365,10 +2567,7 @@ def import_calendar_to_local(db: Session, start: datetime, end: datetime) -> dic
         if not start_dt or not end_dt:
             continue
 
-        row = db.execute(
-            select(CalendarBlock).where(CalendarBlock.outlook_event_id == event_id)
-        ).scalars().first()
-
+        row = existing.get(event_id)
         if row is None:
             row = CalendarBlock(
                 title=event.get("subject") or "Outlook Event",
@@ -2379,7 +2578,8 @@ def import_calendar_to_local(db: Session, start: datetime, end: datetime) -> dic
                 locked=True,
                 outlook_event_id=event_id,
             )
-            db.add(row)
+            existing[event_id] = row
+            new_rows.append(row)
             imported += 1
             continue
 
@@ -2391,6 +2591,8 @@ def import_calendar_to_local(db: Session, start: datetime, end: datetime) -> dic
             row.locked = True
         imported += 1
 
+    if new_rows:
+        db.add_all(new_rows)
     db.commit()
     return {"imported": imported, "events": len(events)}
 
@@ -2400,6 +2602,14 @@ def import_todo_to_local(db: Session, list_id: str) -> dict:
     remote_tasks = list_todo_tasks(db, list_id)
     imported = 0
 
+    todo_ids = [item["id"] for item in remote_tasks if item.get("id")]
+    existing: dict[str, Task] = {}
+    for offset in range(0, len(todo_ids), _IMPORT_LOOKUP_CHUNK):
+        chunk = todo_ids[offset : offset + _IMPORT_LOOKUP_CHUNK]
+        for row in db.execute(select(Task).where(Task.ms_todo_task_id.in_(chunk))).scalars():
+            existing.setdefault(row.ms_todo_task_id, row)
+    new_rows: list[Task] = []
+
     for item in remote_tasks:
         task_id = item.get("id")
         if not task_id:
@@ -2410,7 +2620,7 @@ def import_todo_to_local(db: Session, list_id: str) -> dict:
         local_status = _todo_status_to_local(item.get("status"))
         local_priority = _todo_priority_to_local(item.get("importance"))
 
-        row = db.execute(select(Task).where(Task.ms_todo_task_id == task_id)).scalars().first()
+        row = existing.get(task_id)
         if row is None:
             row = Task(
                 title=item.get("title") or "Microsoft To Do Task",
@@ -2424,7 +2634,8 @@ def import_todo_to_local(db: Session, list_id: str) -> dict:
                 priority=local_priority,
                 effort_minutes=60,
             )
-            db.add(row)
+            existing[task_id] = row
+            new_rows.append(row)
             imported += 1
             continue
 
@@ -2436,5 +2647,7 @@ def import_todo_to_local(db: Session, list_id: str) -> dict:
         row.ms_todo_list_id = list_id
         imported += 1
 
+    if new_rows:
+        db.add_all(new_rows)
     db.commit()
     return {"imported": imported, "tasks": len(remote_tasks)}
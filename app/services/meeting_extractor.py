@@ -25,6 +25,7 @@ ACTION_HINTS = (
     "prepare",
     "update",
 )
+ACTION_HINT_RE = re.compile("|".join(re.escape(keyword) for keyword in ACTION_HINTS), re.IGNORECASE)
 
 ASSIGNEE_RE = re.compile(r"(?P<name>[A-Za-z가-힣0-9_]{2,20})(?:님|이|가|는|은|께서)")
 EFFORT_HOURS_RE = re.compile(r"(?P<hours>\d+)\s*시간")
@@ -32,6 +33,23 @@ EFFORT_MIN_RE = re.compile(r"(?P<mins>\d+)\s*분")
 DUE_KEYWORDS_RE = re.compile(
     r"(오늘|내일|모레|이번\s*주\s*[월화수목금토일]요일|다음\s*주\s*[월화수목금토일]요일|\d{1,2}/\d{1,2}|\d{4}-\d{2}-\d{2})"
 )
+_WS_RE = re.compile(r"\s+")
+_FILLER_RE = re.compile(r"^(그러면|그럼|일단|음|어)\s*")
+
+# Rationale strings indexed by (action_hint << 2) | (due << 1) | assignee.
+_RATIONALES = tuple(
+    ", ".join(
+        part
+        for flag, part in (
+            (mask & 4, "행동 동사/요청 표현 감지"),
+            (mask & 2, "마감 관련 표현 감지"),
+            (mask & 1, "담당자 표현 감지"),
+        )
+        if flag
+    )
+    or "회의 맥락에서 후속 액션 가능성"
+    for mask in range(8)
+)
 
 
 @dataclass
@@ -45,19 +63,23 @@ class DraftActionItem:
 
 
 
-def _parse_due(text: str, base_dt: datetime) -> datetime | None:
+def _due_parser_settings(base_dt: datetime) -> dict:
+    return {
+        "PREFER_DATES_FROM": "future",
+        "RELATIVE_BASE": base_dt,
+        "TIMEZONE": settings.timezone,
+        "RETURN_AS_TIMEZONE_AWARE": True,
+    }
+
+
+def _parse_due(text: str, parser_settings: dict) -> datetime | None:
     match = DUE_KEYWORDS_RE.search(text)
     if not match:
         return None
 
     parsed = dateparser.parse(
         match.group(1),
-        settings={
-            "PREFER_DATES_FROM": "future",
-            "RELATIVE_BASE": base_dt,
-            "TIMEZONE": settings.timezone,
-            "RETURN_AS_TIMEZONE_AWARE": True,
-        },
+        settings=parser_settings,
         languages=["ko", "en"],
     )
     return parsed
@@ -78,8 +100,8 @@ def _parse_effort(text: str) -> int:
 
 
 def _extract_title(line: str) -> str:
-    cleaned = re.sub(r"\s+", " ", line).strip()
-    cleaned = re.sub(r"^(그러면|그럼|일단|음|어)\s*", "", cleaned)
+    cleaned = _WS_RE.sub(" ", line).strip()
+    cleaned = _FILLER_RE.sub("", cleaned)
     if len(cleaned) > 120:
         cleaned = cleaned[:117] + "..."
     return cleaned
@@ -119,17 +141,14 @@ def extract_action_items(
         lines.append(("summary", summary))
 
     seen_titles: set[str] = set()
+    due_settings = _due_parser_settings(base_dt)
 
     for speaker, text in lines:
-        lowered = text.lower()
-        has_action_hint = any(keyword in lowered or keyword in text for keyword in ACTION_HINTS)
+        has_action_hint = ACTION_HINT_RE.search(text) is not None
         if not has_action_hint and "까지" not in text:
             continue
 
-        assignee_match = ASSIGNEE_RE.search(text)
-        assignee = assignee_match.group("name") if assignee_match else speaker
-        due = _parse_due(text, base_dt)
-        effort = _parse_effort(text)
+        # Filter short/duplicate lines before the dateparser call, which dominates per-line cost.
         title = _extract_title(text)
         if len(title) < 6:
             continue
@@ -139,18 +158,14 @@ def extract_action_items(
             continue
         seen_titles.add(dedupe_key)
 
-        confidence = _confidence(bool(due), bool(assignee_match), has_action_hint, effort)
+        assignee_match = ASSIGNEE_RE.search(text)
+        assignee = assignee_match.group("name") if assignee_match else speaker
+        due = _parse_due(text, due_settings)
+        effort = _parse_effort(text)
 
-        rationale_parts = []
-        if has_action_hint:
-            rationale_parts.append("행동 동사/요청 표현 감지")
-        if due:
-            rationale_parts.append("마감 관련 표현 감지")
-        if assignee_match:
-            rationale_parts.append("담당자 표현 감지")
+        confidence = _confidence(bool(due), bool(assignee_match), has_action_hint, effort)
 
-        if not rationale_parts:
-            rationale_parts.append("회의 맥락에서 후속 액션 가능성")
+        rationale = _RATIONALES[(has_action_hint << 2) | (bool(due) << 1) | bool(assignee_match)]
 
         candidates.append(
             DraftActionItem(
@@ -159,7 +174,7 @@ def extract_action_items(
                 due=due,
                 effort_minutes=effort,
                 confidence=confidence,
-                rationale=", ".join(rationale_parts),
+                rationale=rationale,
             )
         )
 
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import json
+import atexit
+import hashlib
 import logging
 import re
 import threading
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Literal
+from functools import lru_cache
+from typing import Final, Literal, TypeVar
 from zoneinfo import ZoneInfo
 
 import dateparser
+import httpx
+import orjson
 from pydantic import BaseModel, Field, ValidationError
 
 from app.config import settings
@@ -60,11 +66,19 @@ _OPENAI_TIMEOUT_WINDOW_SECONDS = 60.0
 _OPENAI_TIMEOUT_FAIL_THRESHOLD = 2
 _OPENAI_TIMEOUT_COOLDOWN_SECONDS = 30.0
 _OPENAI_TIMEOUT_MAX_LOG_ENTRIES = 12
+_OPENAI_FAILURE_LOG_INTERVAL_SECONDS = 1.0
 
 _openai_timeout_events: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=_OPENAI_TIMEOUT_MAX_LOG_ENTRIES))
 _openai_timeout_blocked_until: dict[str, float] = {}
+_openai_failure_last_logged: dict[tuple[str, str], float] = {}
 _openai_client_lock = threading.Lock()
-_openai_clients: dict[float, OpenAI] = {}
+_openai_client: OpenAI | None = None
+_openai_http_client: httpx.Client | None = None
+_openai_hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="openai-hedge")
+
+_OPENAI_RESPONSE_CACHE_MAX_ENTRIES = 512
+_openai_response_cache: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+_openai_response_cache_lock = threading.Lock()
 
 
 def _is_openai_timeout_error(exc: Exception) -> bool:
@@ -108,11 +122,68 @@ def _record_openai_timeout(purpose: MODEL_PURPOSE) -> None:
         )
 
 
+def _should_log_openai_failure(purpose: MODEL_PURPOSE, model: str) -> bool:
+    # Error storms across concurrent requests would otherwise serialize on the log handler lock.
+    now = time.monotonic()
+    key = (purpose, model)
+    if now - _openai_failure_last_logged.get(key, 0.0) < _OPENAI_FAILURE_LOG_INTERVAL_SECONDS:
+        return False
+    _openai_failure_last_logged[key] = now
+    return True
+
+
 def _clear_openai_timeout_state(purpose: MODEL_PURPOSE) -> None:
     _openai_timeout_events[purpose].clear()
     _openai_timeout_blocked_until.pop(purpose, None)
 
 
+def _response_cache_key(system_prompt: str, user_prompt: str, purpose: str, temperature: float) -> bytes:
+    raw = "\x00".join((system_prompt, user_prompt, purpose, repr(temperature)))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
+def _cached_response(key: bytes) -> str | None:
+    now = time.monotonic()
+    with _openai_response_cache_lock:
+        entry = _openai_response_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at <= now:
+            del _openai_response_cache[key]
+            return None
+        _openai_response_cache.move_to_end(key)
+        return content
+
+
+def _store_response(key: bytes | None, content: str) -> None:
+    ttl = float(settings.openai_response_cache_seconds)
+    if key is None or ttl <= 0:
+        return
+    with _openai_response_cache_lock:
+        _openai_response_cache[key] = (time.monotonic() + ttl, content)
+        _openai_response_cache.move_to_end(key)
+        while len(_openai_response_cache) > _OPENAI_RESPONSE_CACHE_MAX_ENTRIES:
+            _openai_response_cache.popitem(last=False)
+
+
+def _forget_response(content: str) -> None:
+    with _openai_response_cache_lock:
+        stale = [key for key, (_, cached) in _openai_response_cache.items() if cached == content]
+        for key in stale:
+            del _openai_response_cache[key]
+
+
+def _estimate_tokens(text: str) -> int:
+    # ~1 token per Hangul syllable (3 UTF-8 bytes) and fewer for ASCII; errs on the high side.
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def _prompt_datetime(value: datetime) -> str:
+    # Minute precision is enough for planning and keeps repeat prompts identical.
+    return value.replace(second=0, microsecond=0).isoformat()
+
+
 class ActionItemOutput(BaseModel):
     title: str = Field(min_length=3, max_length=180)
     assignee_name: str | None = None
@@ -474,7 +545,9 @@ def _extract_first_datetime_with_time_hint(text: str | None, base_dt: datetime)
 MODEL_PURPOSE = Literal["default", "assistant", "nli", "extraction"]
 
 
-def _model_candidates(purpose: MODEL_PURPOSE) -> list[str]:
+# settings is frozen, so each purpose always resolves to the same candidates.
+@lru_cache(maxsize=4)
+def _model_candidates(purpose: MODEL_PURPOSE) -> tuple[str, ...]:
     candidates: list[str] = []
     if purpose == "assistant":
         candidates.append(settings.openai_assistant_model)
@@ -484,16 +557,21 @@ def _model_candidates(purpose: MODEL_PURPOSE) -> list[str]:
         candidates.append(settings.openai_extraction_model)
 
     candidates.extend([settings.openai_model, settings.openai_fallback_model])
+    return tuple(dict.fromkeys(name for name in ((model or "").strip() for model in candidates) if name))
 
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for model in candidates:
-        name = (model or "").strip()
-        if not name or name in seen:
-            continue
-        deduped.append(name)
-        seen.add(name)
-    return deduped
+
+def warm_up_openai_parsers() -> None:
+    """Pay first-use parsing costs at startup instead of on the first user request."""
+    for model, sample in (
+        (ActionItemsEnvelope, '{"items":[{"title":"warm up"}]}'),
+        (NLIOutput, '{"intent":"unknown"}'),
+        (AssistantActionOutput, '{"intent":"unknown"}'),
+        (AssistantPlanOutput, '{"actions":[{"intent":"unknown"}]}'),
+        (EmailTriageOutput, '{"classification":"no_action","reason":"warm up"}'),
+    ):
+        model.model_validate_json(sample)
+    # dateparser loads its ko/en locale data lazily on the first parse (tens of ms).
+    dateparser.parse("내일 오후 3시", languages=["ko", "en"])
 
 
 def is_openai_available() -> bool:
@@ -511,20 +589,35 @@ def _purpose_timeout_seconds(purpose: MODEL_PURPOSE) -> float:
     return budgets.get(purpose, default)
 
 
-def _client(timeout_seconds: float | None = None) -> OpenAI:
+def _request_timeout(timeout_seconds: float | None = None) -> float:
+    timeout = float(timeout_seconds) if timeout_seconds is not None else float(settings.openai_timeout_seconds)
+    return max(6.0, min(timeout, 14.0))
+
+
+def _client() -> OpenAI:
+    global _openai_client, _openai_http_client
     if OpenAI is None:
         raise OpenAIIntegrationError("openai package not installed")
     if not settings.openai_api_key:
         raise OpenAIIntegrationError("OPENAI_API_KEY is not configured")
-    timeout = float(timeout_seconds) if timeout_seconds is not None else float(settings.openai_timeout_seconds)
-    timeout = max(6.0, min(timeout, 14.0))
-    timeout_key = round(timeout, 2)
+    if _openai_client is not None:
+        return _openai_client
+
     with _openai_client_lock:
-        client = _openai_clients.get(timeout_key)
-        if client is None:
-            client = OpenAI(api_key=settings.openai_api_key, timeout=timeout)
-            _openai_clients[timeout_key] = client
-        return client
+        if _openai_client is None:
+            # One process-wide client over a keep-alive HTTP/2 pool; per-attempt
+            # timeouts are passed on each create() call instead.
+            _openai_http_client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=120.0),
+            )
+            _openai_client = OpenAI(
+                api_key=settings.openai_api_key,
+                timeout=_request_timeout(),
+                http_client=_openai_http_client,
+            )
+            atexit.register(_openai_http_client.close)
+    return _openai_client
 
 
 def _purpose_retry_limits(purpose: MODEL_PURPOSE) -> int:
@@ -538,13 +631,139 @@ def _purpose_retry_limits(purpose: MODEL_PURPOSE) -> int:
 
 
 
+_JSON_STRUCTURE_RE = re.compile(r'[{}"\\]')
+
+
+class _HedgeSuperseded(Exception):
+    """Raised in a hedged request once the other model has already answered."""
+
+
+def _stream_json_content(client: OpenAI, request_args: dict, cancelled: threading.Event | None = None) -> str:
+    """Stream a JSON-mode completion and stop reading once the top-level object closes."""
+    # Streaming keeps the read timeout per chunk, so enforce the request's total budget here.
+    timeout_seconds = float(request_args["timeout"])
+    deadline = time.monotonic() + timeout_seconds
+    parts: list[str] = []
+    depth = 0
+    in_string = False
+    offset = 0
+    escaped_at = -1
+    stream = client.chat.completions.create(**request_args, stream=True)
+    try:
+        for chunk in stream:
+            if cancelled is not None and cancelled.is_set():
+                raise _HedgeSuperseded()
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"OpenAI stream timed out after {timeout_seconds:.1f}s")
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            for match in _JSON_STRUCTURE_RE.finditer(delta):
+                position = offset + match.start()
+                if position == escaped_at:
+                    continue
+                char = match.group()
+                if char == "\\":
+                    if in_string:
+                        escaped_at = position + 1
+                elif char == '"':
+                    in_string = not in_string
+                elif not in_string:
+                    depth += 1 if char == "{" else -1
+                    if depth == 0:
+                        return "".join(parts)[: offset + match.end()]
+            offset += len(delta)
+    finally:
+        stream.close()
+    if not parts:
+        return "{}"
+    raise ValueError(f"OpenAI stream ended before the JSON object closed: {_clip_text(''.join(parts), 80)}")
+
+
+_OutputModel = TypeVar("_OutputModel", bound=BaseModel)
+
+
+def _parse_output(model: type[_OutputModel], content: str, label: str) -> _OutputModel:
+    try:
+        return model.model_validate_json(content)
+    except ValidationError as exc:
+        # Slow path for replies wrapped in prose or code fences.
+        start = content.find("{")
+        end = content.rfind("}")
+        trimmed = content[start : end + 1] if 0 <= start < end else content
+        if trimmed != content:
+            try:
+                data = orjson.loads(trimmed)
+                return model.model_validate(data)
+            except (ValueError, ValidationError):
+                pass
+        # Keep the bad reply from being replayed out of the response cache.
+        _forget_response(content)
+        raise OpenAIIntegrationError(f"OpenAI {label} schema validation failed: {exc}") from exc
+
+
+def _run_hedged(
+    run_model: Callable[[str, threading.Event | None], str],
+    primary: str,
+    backup: str,
+    hedge_delay: float,
+    deadline: float,
+) -> str:
+    """Start the backup model if the primary has not answered within hedge_delay; first success wins."""
+    cancel_events = (threading.Event(), threading.Event())
+    first = _openai_hedge_pool.submit(run_model, primary, cancel_events[0])
+    done, _ = wait((first,), timeout=max(0.0, min(hedge_delay, deadline - time.monotonic())))
+    if done and first.exception() is None:
+        return first.result()
+
+    # Slow or failed primary: the backup runs alongside (or instead of) it.
+    second = _openai_hedge_pool.submit(run_model, backup, cancel_events[1])
+    pending = {second} if done else {first, second}
+    last_error: BaseException | None = first.exception() if done else None
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                # The loser stops at its next stream chunk and skips breaker accounting.
+                for event in cancel_events:
+                    event.set()
+                return future.result()
+            last_error = future.exception()
+    raise last_error or TimeoutError("OpenAI hedged request exceeded the total wait budget")
+
+
 def _chat_json(
     system_prompt: str,
     user_prompt: str,
     *,
     purpose: MODEL_PURPOSE = "default",
     temperature: float | None = None,
-) -> dict:
+) -> str:
+    # Default fits 128k-context models (gpt-5-mini accepts more); 0 disables the guard.
+    max_input_tokens = int(settings.openai_max_input_tokens)
+    if max_input_tokens > 0:
+        input_tokens = _estimate_tokens(system_prompt) + _estimate_tokens(user_prompt)
+        if input_tokens > max_input_tokens:
+            # Fail before the round trip instead of waiting for a context-length error.
+            raise OpenAIIntegrationError(
+                f"OpenAI input too large for purpose={purpose}: ~{input_tokens} tokens "
+                f"(limit {max_input_tokens})"
+            )
+
+    temp = settings.openai_temperature if temperature is None else float(temperature)
+    # Only deterministic requests are cached; at temperature > 0 callers expect varied replies.
+    cache_key = _response_cache_key(system_prompt, user_prompt, purpose, temp) if temp == 0 else None
+    if cache_key is not None:
+        cached = _cached_response(cache_key)
+        if cached is not None:
+            return cached
+
     _check_openai_timeout_gate(purpose)
 
     models = _model_candidates(purpose)
@@ -552,17 +771,19 @@ def _chat_json(
         raise OpenAIIntegrationError("No OpenAI model candidates configured")
 
     request_timeout = _purpose_timeout_seconds(purpose)
-    temp = settings.openai_temperature if temperature is None else float(temperature)
     last_error: Exception | None = None
     started_at = time.monotonic()
     # Cap total wait so model fallback/retries do not multiply user-facing latency.
     max_total_wait = max(3.0, request_timeout + 0.4)
     max_retries = _purpose_retry_limits(purpose)
+    # Routes requests sharing a system prompt to the same provider-side prefix cache.
+    prompt_cache_key = f"aawo-{purpose}"
 
-    for model in models:
+    def run_model(model: str, cancelled: threading.Event | None = None) -> str:
+        model_error: Exception | None = None
         for attempt in range(max_retries + 1):
             attempt_timeout = request_timeout if attempt == 0 else max(5.0, request_timeout * 0.75)
-            client = _client(timeout_seconds=attempt_timeout)
+            client = _client()
             content = ""
             try:
                 request_args = {
@@ -573,16 +794,14 @@ def _chat_json(
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_prompt},
                     ],
+                    "extra_body": {"prompt_cache_key": prompt_cache_key},
+                    "timeout": _request_timeout(attempt_timeout),
                 }
-                response = client.chat.completions.create(**request_args)
-                content = response.choices[0].message.content or "{}"
-                if isinstance(content, list):
-                    content = "".join(
-                        part.get("text", "") if isinstance(part, dict) else str(part)
-                        for part in content
-                    )
+                content = _stream_json_content(client, request_args, cancelled)
                 _clear_openai_timeout_state(purpose)
-                return json.loads(content)
+                return content
+            except _HedgeSuperseded:
+                raise
             except Exception as exc:  # noqa: BLE001
                 # Some models (e.g. gpt-5-mini) only allow default temperature.
                 text = str(exc)
@@ -595,29 +814,29 @@ def _chat_json(
                                 {"role": "system", "content": system_prompt},
                                 {"role": "user", "content": user_prompt},
                             ],
+                            "extra_body": {"prompt_cache_key": prompt_cache_key},
+                            "timeout": request_args["timeout"],
                         }
-                        response = client.chat.completions.create(**retry_args)
-                        content = response.choices[0].message.content or "{}"
-                        if isinstance(content, list):
-                            content = "".join(
-                                part.get("text", "") if isinstance(part, dict) else str(part)
-                                for part in content
-                            )
+                        content = _stream_json_content(client, retry_args, cancelled)
                         _clear_openai_timeout_state(purpose)
-                        return json.loads(content)
+                        return content
                     except Exception as retry_exc:  # noqa: BLE001
                         exc = retry_exc
-                last_error = exc
+                if cancelled is not None and cancelled.is_set():
+                    # The other hedged model already answered; this failure says nothing about the breaker.
+                    raise _HedgeSuperseded() from exc
+                model_error = exc
                 is_timeout = _is_openai_timeout_error(exc)
                 if is_timeout:
                     _record_openai_timeout(purpose)
-                logger.warning(
-                    "OpenAI request failed for purpose=%s model=%s attempt=%s: %s",
-                    purpose,
-                    model,
-                    attempt + 1,
-                    exc,
-                )
+                if _should_log_openai_failure(purpose, model):
+                    logger.warning(
+                        "OpenAI request failed for purpose=%s model=%s attempt=%s: %s",
+                        purpose,
+                        model,
+                        attempt + 1,
+                        exc,
+                    )
 
                 elapsed = time.monotonic() - started_at
                 exhausted = attempt >= max_retries
@@ -641,67 +860,256 @@ def _chat_json(
                 backoff = min(0.25 * (attempt + 1), 0.8)
                 time.sleep(backoff)
 
+        raise model_error or OpenAIIntegrationError(f"OpenAI request failed for model={model}")
+
+    remaining = list(models)
+    hedge_delay = float(settings.openai_hedge_delay_seconds)
+    if hedge_delay > 0 and len(remaining) >= 2:
+        try:
+            content = _run_hedged(run_model, remaining[0], remaining[1], hedge_delay, started_at + max_total_wait)
+            _store_response(cache_key, content)
+            return content
+        except Exception as exc:  # noqa: BLE001
+            last_error = exc
+        remaining = remaining[2:]
+
+    for model in remaining:
         if time.monotonic() - started_at >= max_total_wait:
             break
+        try:
+            content = run_model(model)
+        except Exception as exc:  # noqa: BLE001
+            last_error = exc
+            continue
+        _store_response(cache_key, content)
+        return content
 
     raise OpenAIIntegrationError(
-        f"OpenAI API request failed for all models={models}: {last_error}"
+        f"OpenAI API request failed for all models={list(models)}: {last_error}"
     ) from last_error
 
 
 
-def _parse_due(value: str | None, base_dt: datetime) -> datetime | None:
-    if not value:
-        return None
+# System prompts are module constants so every request sends a byte-identical
+# prefix; volatile values (base_datetime, user text) go last in the user prompt.
+_EXTRACTION_SYSTEM_PROMPT: Final[str] = (
+    "You extract concrete meeting action items only."
+    " Return strict JSON object only with shape:"
+    ' {"items":[{"title":string,"assignee_name":string|null,"due":string|null,'
+    '"effort_minutes":int,"confidence":number,"rationale":string}]}. '
+    "Exclude vague ideas. Use null when unknown."
+    " confidence must be between 0 and 1."
+    " due should be ISO-8601 datetime if inferable, else null."
+)
+
+
+_NLI_SYSTEM_PROMPT: Final[str] = (
+    "You parse Korean/English planning commands into intent JSON."
+    " Return strict JSON only with fields:"
+    " intent(create_task|create_event|update_task|delete_task|update_due|update_priority|"
+    "move_event|update_event|reschedule_request|reschedule_after_hour|delete_duplicate_tasks|delete_duplicate_events|"
+    "delete_event|list_tasks|list_events|find_free_time|unknown),"
+    " title, task_keyword, task_title, due, start, end, new_title, effort_minutes, priority, cutoff_hour,"
+    " time_hint, duration_minutes, limit, note. "
+    " If user asks to add a schedule/meeting/calendar entry, use create_event."
+    " Use create_task only for to-do/task requests."
+    " For create_event/create_task, title must be a concise semantic subject"
+    " (strip date/time words and command words like 추가/등록/생성)."
+    " Example: '이번주 목요일 오후3시에 공인알림 미팅 일정 추가' -> title='공인알림 미팅'."
+    " If only a generic title is available (e.g., 미팅/회의/일정/task), keep it generic and do not invent details."
+    " For move_event/update_event, extract task_keyword/title from event phrase and set start when available."
+    " If user changes an existing event's date/time (e.g. '내일 오후 4시로 변경'), you MUST use move_event."
+    " Use update_event only for renaming/changing the event title or duration/details, not time moves."
+    " For update_event include new_title (target title) when user asks to rename."
+    " If user asks to extend/shorten event duration, keep intent=update_event and set duration_minutes or end."
+    " For reschedule_request include reschedule hint in time_hint/title."
+    " For requests like '오후 6시 이후', 'after 6pm', parse intent=reschedule_after_hour and cutoff_hour=18/20 etc."
+    " For duplicate task cleanup ('중복', '중복된 태스크', '중복 태스크 정리'), use delete_duplicate_tasks."
+    " For duplicate event cleanup ('중복된 미팅 삭제', '중복 일정 정리'), use delete_duplicate_events."
+    " For explicit deadline updates use update_due."
+    " For priority updates use update_priority."
+    " For update_task/update_due/update_priority, title/task_keyword should identify the target task."
+    "Use null for unknown values."
+    " due should be ISO-8601 datetime when possible."
+)
+
+
+_EMAIL_TRIAGE_SYSTEM_PROMPT: Final[str] = (
+    "You classify incoming work email for an AI planner."
+    " Return strict JSON only with fields:"
+    " classification(no_action|task|event|task_and_event|unclear),"
+    " reason, confidence, task_title, task_due, task_priority, task_description,"
+    " event_title, event_start, event_end, event_location."
+    " Rules:"
+    " 1) no_action if message is informational only, newsletter/promotional,"
+    "    FYI/announcement, automated receipt/notification, already-resolved thread,"
+    "    or does not require recipient action."
+    " 2) task/event/task_and_event only when explicit action or schedule commitment exists."
+    " 3) Do not hallucinate missing details."
+    " 4) task_title/event_title should be concise and concrete."
+    " 5) Datetime fields should be ISO-8601 when inferable; otherwise null."
+)
+
+
+_ASSISTANT_ACTION_SYSTEM_PROMPT: Final[str] = (
+    "You are an assistant action parser for a work planner."
+    " Return strict JSON only with fields: "
+    "intent(create_task|create_event|update_task|delete_task|start_task|reschedule_request|complete_task|"
+    "update_priority|list_tasks|list_events|find_free_time|move_event|register_meeting_note|unknown), "
+    "title, due, effort_minutes, priority, meeting_note, note. "
+    "For meeting-note style text, use register_meeting_note and copy full note text into meeting_note."
+    " For task completion/priority update, title should be the target task title or keyword."
+    " For schedule/meeting add requests, use create_event."
+    " For create_event/create_task, title must be a concise semantic subject"
+    " (exclude date/time text and command words)."
+    " If only generic title words are available, keep them as-is and do not hallucinate."
+    " Use null for unknown values."
+    " due should be ISO-8601 datetime when possible."
+)
+
+
+_ASSISTANT_PLAN_SYSTEM_PROMPT: Final[str] = (
+    "You are an action planner for a Korean/English work assistant."
+    " Return strict JSON only with shape:"
+    ' {"actions":[{"intent":string,"title":string|null,"task_keyword":string|null,"due":string|null,'
+    '"cutoff_hour":int|null,"effort_minutes":int|null,"priority":string|null,"status":string|null,'
+    '"meeting_note":string|null,"reschedule_hint":string|null,"new_title":string|null,'
+    '"start":string|null,"end":string|null,"duration_minutes":int|null,'
+    '"description":string|null,"target_date":string|null,"limit":int|null}],'
+    '"note":string|null}.'
+    " Supported intent values are:"
+    " create_task, create_event, update_task, delete_task, start_task, reschedule_request, reschedule_after_hour,"
+    " complete_task, update_priority, update_due, list_tasks, list_events, find_free_time, move_event,"
+    " delete_duplicate_tasks, delete_duplicate_events, register_meeting_note, delete_event, update_event, unknown."
+    " Parse multiple requests in one message into multiple actions in order."
+    " CRITICAL: if user asks to add schedule/meeting/calendar event (일정/미팅/회의/캘린더 + 추가/등록/잡아줘),"
+    " you MUST output create_event, not create_task."
+    " Use create_task only when user explicitly asks for to-do/task/할일."
+    " For create_event/create_task, title must be a concise semantic subject, not the whole sentence."
+    " Remove date/time words and command words from title."
+    " Example: '이번주 목요일 오후3시에 공인알림 미팅 일정 추가' => title='공인알림 미팅'."
+    " If you only know a generic title (미팅/회의/일정/task), keep it generic; do not invent details."
+    " For update_task, put changed fields into priority/status/due/description/effort_minutes/new_title."
+    " For move_event, set task_keyword to existing event title and set start (and optionally end or duration_minutes)."
+    " If the user changes an existing event's date/time, you MUST output move_event, not update_event."
+    " Use update_event only when the event title/details/duration are being edited."
+    " If user asks to extend/shorten an existing event, keep intent=update_event and set duration_minutes or end."
+    " For list_events/list_tasks/find_free_time, use target_date/limit/duration_minutes when inferable."
+    " If user asks to show/list tasks, MUST output list_tasks."
+    " If user asks to show/list schedule/calendar/events, MUST output list_events."
+    " If user asks for available/free time slots, MUST output find_free_time."
+    " For complete/update actions, choose task_keyword from existing task titles and make it specific."
+    " For delete_event or update_event, choose task_keyword from existing event titles when possible."
+    " For update_event, set new_title when user asks to rename the event."
+    " If user message is approval intent and contains approval id, still return unknown and ask a Korean clarification"
+    " question in note only when target approval cannot be inferred."
+    " Never use a generic one-word keyword like '작업', '고객', '미팅'."
+    " For requests like 'after 6pm' or '오후 6시 이후', use reschedule_after_hour and set cutoff_hour."
+    " For duplicate task cleanup requests, use delete_duplicate_tasks."
+    " For duplicate event cleanup requests, use delete_duplicate_events."
+    " If matching is uncertain, keep intent as unknown and set note as one concise clarification question in Korean."
+    " due should be ISO-8601 datetime when inferable, else null."
+    " If message is meeting notes/transcript, use register_meeting_note with full note in meeting_note."
+    " For meeting-note messages, do not generate extra create_task actions."
+    " Resolve references like '그거/방금 거/that one' using recent conversation when possible."
+    " Do not answer user-facing content in note."
+    " note is only for one short clarification question when all actions are unknown."
+    " Prefer executable actions over unknown when evidence exists in contexts."
+    " Keep actions concise and executable."
+)
+
 
-    parsed = dateparser.parse(
+@lru_cache(maxsize=4096)
+def _parse_due_cached(value: str, base_dt: datetime, timezone: str) -> datetime | None:
+    return dateparser.parse(
         value,
         settings={
             "PREFER_DATES_FROM": "future",
             "RELATIVE_BASE": base_dt,
-            "TIMEZONE": settings.timezone,
+            "TIMEZONE": timezone,
             "RETURN_AS_TIMEZONE_AWARE": True,
         },
         languages=["ko", "en"],
     )
-    return parsed
 
 
+def _parse_due(value: str | None, base_dt: datetime) -> datetime | None:
+    if not value:
+        return None
+
+    # The model usually returns ISO-8601 already; only free text needs dateparser.
+    text = value.strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return _parse_due_cached(text, base_dt.replace(second=0, microsecond=0), settings.timezone)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=_timezone_local())
+    return parsed.astimezone(_timezone_local())
+
+
+
+_MIN_CLIPPED_UTTERANCE_BYTES = 192
+
+
+def _budget_transcript_lines(transcript: list[dict], budget: int) -> list[str]:
+    """Keep the latest utterances that fit the token budget; action items cluster near the end."""
+    lines: list[str] = []
+    seen_lines: set[tuple[str, str]] = set()
+    for utterance in reversed(transcript):
+        text = (utterance.get("text") or "").strip()
+        if not text:
+            continue
+        speaker = utterance.get("speaker") or "참석자"
+        # Repeated backchannel/restated lines add tokens but no new action items.
+        line_key = (speaker, text.lower())
+        if line_key in seen_lines:
+            continue
+        seen_lines.add(line_key)
+        line = f"- {speaker}: {text}"
+        cost = _estimate_tokens(line)
+        if cost > budget:
+            # Clip the utterance that overflows (keeping its end) rather than dropping it,
+            # so a long final note never leaves the transcript empty.
+            prefix = f"- {speaker}: …"
+            room = (budget - _estimate_tokens(prefix)) * 3
+            if not lines:
+                room = max(room, _MIN_CLIPPED_UTTERANCE_BYTES)
+            if room > 0:
+                lines.append(prefix + text.encode("utf-8")[-room:].decode("utf-8", "ignore"))
+            break
+        budget -= cost
+        lines.append(line)
+    lines.reverse()
+    return lines
+
 
 def extract_action_items_openai(transcript: list[dict], summary: str | None, base_dt: datetime) -> list[DraftActionItem]:
     if not transcript and not summary:
         return []
 
-    transcript_lines = []
-    for utterance in transcript[:180]:
-        speaker = utterance.get("speaker") or "참석자"
-        text = (utterance.get("text") or "").strip()
-        if text:
-            transcript_lines.append(f"- {speaker}: {text}")
-
-    system_prompt = (
-        "You extract concrete meeting action items only."
-        " Return strict JSON object only with shape:"
-        ' {"items":[{"title":string,"assignee_name":string|null,"due":string|null,'
-        '"effort_minutes":int,"confidence":number,"rationale":string}]}. '
-        "Exclude vague ideas. Use null when unknown."
-        " confidence must be between 0 and 1."
-        " due should be ISO-8601 datetime if inferable, else null."
-    )
-
-    user_prompt = (
-        f"timezone={settings.timezone}\n"
-        f"base_datetime={base_dt.isoformat()}\n"
-        f"summary={(summary or '').strip()}\n"
-        "transcript:\n"
-        f"{'\n'.join(transcript_lines)}"
+    budget = int(settings.openai_extraction_max_prompt_tokens)
+    # The summary may use at most half the budget; _estimate_tokens counts ~3 UTF-8 bytes per token.
+    summary_text = (summary or "").strip()
+    if _estimate_tokens(summary_text) > budget // 2:
+        summary_text = summary_text.encode("utf-8")[: (budget // 2) * 3].decode("utf-8", "ignore")
+    transcript_lines = _budget_transcript_lines(transcript, budget - _estimate_tokens(summary_text))
+    if len(transcript_lines) < len(transcript):
+        logger.debug("Extraction prompt kept %s of %s utterances", len(transcript_lines), len(transcript))
+
+    user_prompt = "\n".join(
+        [
+            f"timezone={settings.timezone}",
+            f"base_datetime={_prompt_datetime(base_dt)}",
+            f"summary={summary_text}",
+            "transcript:",
+            *(transcript_lines or [""]),
+        ]
     )
 
-    payload = _chat_json(system_prompt, user_prompt, purpose="extraction")
-    try:
-        envelope = ActionItemsEnvelope.model_validate(payload)
-    except ValidationError as exc:
-        raise OpenAIIntegrationError(f"OpenAI action items schema validation failed: {exc}") from exc
+    # Extraction and NLI are parsing tasks: temperature 0 keeps them deterministic and cacheable.
+    content = _chat_json(_EXTRACTION_SYSTEM_PROMPT, user_prompt, purpose="extraction", temperature=0.0)
+    envelope = _parse_output(ActionItemsEnvelope, content, "action items")
 
     items: list[DraftActionItem] = []
     seen: set[str] = set()
@@ -730,48 +1138,60 @@ def extract_action_items_openai(transcript: list[dict], summary: str | None, bas
 
 
 
+# Only whole-command phrasings are answered locally; anything looser (or negated)
+# goes to the model, since both intents act on every matching item.
+_NLI_NEGATION_RE = re.compile(r"지\s*마|말아|않|\bdon'?t\b|\bnot\b|\bnever\b", re.IGNORECASE)
+_NLI_REQUEST_TAIL = r"(?:\s*(?:해\s*줘|해\s*주세요|해\s*줄래|하기|해))?\s*[.!~]*"
+_NLI_DUPLICATE_CMD_RE = re.compile(
+    r"^(?:중복(?:된)?\s*(?P<ko>일정|미팅|회의|할\s*일|태스크)(?:들)?\s*(?:을|를)?\s*(?:삭제|정리)"
+    + _NLI_REQUEST_TAIL
+    + r"|(?:delete|remove|clean\s*up)\s+duplicate\s+(?P<en>events|meetings|tasks))$",
+    re.IGNORECASE,
+)
+_NLI_AFTER_HOUR_CMD_RE = re.compile(
+    r"^(?P<hint>오후\s*(?P<hour>\d{1,2})\s*시\s*이후)\s*(?:일정|미팅|회의)(?:들)?\s*(?:을|를)?\s*"
+    r"(?:모두|전부)?\s*재배치"
+    + _NLI_REQUEST_TAIL
+    + "$"
+)
+
+
+def _try_local_nli(text: str) -> NLIOutput | None:
+    """Parse unambiguous commands without the LLM; None means the model should decide."""
+    if _NLI_NEGATION_RE.search(text):
+        return None
+
+    match = _NLI_DUPLICATE_CMD_RE.match(text)
+    if match:
+        kind = (match.group("ko") or match.group("en")).lower()
+        is_task = kind in {"tasks", "태스크"} or kind.startswith("할")
+        return NLIOutput(intent="delete_duplicate_tasks" if is_task else "delete_duplicate_events")
+
+    match = _NLI_AFTER_HOUR_CMD_RE.match(text)
+    if match:
+        hour = int(match.group("hour"))
+        if 1 <= hour <= 11:
+            hour += 12
+        if 12 <= hour <= 23:
+            return NLIOutput(intent="reschedule_after_hour", cutoff_hour=hour, time_hint=match.group("hint"))
+    return None
+
+
 def parse_nli_openai(text: str, base_dt: datetime) -> NLIOutput:
-    system_prompt = (
-        "You parse Korean/English planning commands into intent JSON."
-        " Return strict JSON only with fields:"
-        " intent(create_task|create_event|update_task|delete_task|update_due|update_priority|"
-        "move_event|update_event|reschedule_request|reschedule_after_hour|delete_duplicate_tasks|delete_duplicate_events|"
-        "delete_event|list_tasks|list_events|find_free_time|unknown),"
-        " title, task_keyword, task_title, due, start, end, new_title, effort_minutes, priority, cutoff_hour,"
-        " time_hint, duration_minutes, limit, note. "
-        " If user asks to add a schedule/meeting/calendar entry, use create_event."
-        " Use create_task only for to-do/task requests."
-        " For create_event/create_task, title must be a concise semantic subject"
-        " (strip date/time words and command words like 추가/등록/생성)."
-        " Example: '이번주 목요일 오후3시에 공인알림 미팅 일정 추가' -> title='공인알림 미팅'."
-        " If only a generic title is available (e.g., 미팅/회의/일정/task), keep it generic and do not invent details."
-        " For move_event/update_event, extract task_keyword/title from event phrase and set start when available."
-        " If user changes an existing event's date/time (e.g. '내일 오후 4시로 변경'), you MUST use move_event."
-        " Use update_event only for renaming/changing the event title or duration/details, not time moves."
-        " For update_event include new_title (target title) when user asks to rename."
-        " If user asks to extend/shorten event duration, keep intent=update_event and set duration_minutes or end."
-        " For reschedule_request include reschedule hint in time_hint/title."
-        " For requests like '오후 6시 이후', 'after 6pm', parse intent=reschedule_after_hour and cutoff_hour=18/20 etc."
-        " For duplicate task cleanup ('중복', '중복된 태스크', '중복 태스크 정리'), use delete_duplicate_tasks."
-        " For duplicate event cleanup ('중복된 미팅 삭제', '중복 일정 정리'), use delete_duplicate_events."
-        " For explicit deadline updates use update_due."
-        " For priority updates use update_priority."
-        " For update_task/update_due/update_priority, title/task_keyword should identify the target task."
-        "Use null for unknown values."
-        " due should be ISO-8601 datetime when possible."
-    )
+    # Collapse whitespace so trivially different repeats share a response cache entry.
+    text = " ".join(text.split())
+    local = _try_local_nli(text)
+    if local is not None:
+        return local
 
     user_prompt = (
         f"timezone={settings.timezone}\n"
-        f"base_datetime={base_dt.isoformat()}\n"
+        f"base_datetime={_prompt_datetime(base_dt)}\n"
         f"command={text}"
     )
 
-    payload = _chat_json(system_prompt, user_prompt, purpose="nli")
-    try:
-        parsed = NLIOutput.model_validate(payload)
-    except ValidationError as exc:
-        raise OpenAIIntegrationError(f"OpenAI NLI schema validation failed: {exc}") from exc
+    content = _chat_json(_NLI_SYSTEM_PROMPT, user_prompt, purpose="nli", temperature=0.0)
+    parsed = _parse_output(NLIOutput, content, "NLI")
 
     return parsed
 
@@ -783,22 +1203,6 @@ def parse_email_triage_openai(
     body_preview: str | None,
     received_at: datetime,
 ) -> EmailTriageOutput:
-    system_prompt = (
-        "You classify incoming work email for an AI planner."
-        " Return strict JSON only with fields:"
-        " classification(no_action|task|event|task_and_event|unclear),"
-        " reason, confidence, task_title, task_due, task_priority, task_description,"
-        " event_title, event_start, event_end, event_location."
-        " Rules:"
-        " 1) no_action if message is informational only, newsletter/promotional,"
-        "    FYI/announcement, automated receipt/notification, already-resolved thread,"
-        "    or does not require recipient action."
-        " 2) task/event/task_and_event only when explicit action or schedule commitment exists."
-        " 3) Do not hallucinate missing details."
-        " 4) task_title/event_title should be concise and concrete."
-        " 5) Datetime fields should be ISO-8601 when inferable; otherwise null."
-    )
-
     user_prompt = (
         f"timezone={settings.timezone}\n"
         f"received_at={received_at.isoformat()}\n"
@@ -807,11 +1211,13 @@ def parse_email_triage_openai(
         f"body_preview={(body_preview or '').strip()}\n"
     )
 
-    payload = _chat_json(system_prompt, user_prompt, purpose="assistant", temperature=settings.openai_assistant_temperature)
-    try:
-        parsed = EmailTriageOutput.model_validate(payload)
-    except ValidationError as exc:
-        raise OpenAIIntegrationError(f"OpenAI email triage schema validation failed: {exc}") from exc
+    content = _chat_json(
+        _EMAIL_TRIAGE_SYSTEM_PROMPT,
+        user_prompt,
+        purpose="assistant",
+        temperature=settings.openai_assistant_temperature,
+    )
+    parsed = _parse_output(EmailTriageOutput, content, "email triage")
 
     combined = f"{subject.strip()}\n{(body_preview or '').strip()}".strip()
     explicit_time_in_body = _contains_explicit_time(combined)
@@ -834,54 +1240,30 @@ def parse_email_triage_openai(
     # Normalize inferred datetimes if model returns natural language.
     task_due = _parse_datetime_value(parsed.task_due, received_at)
 
-    return EmailTriageOutput(
-        classification=parsed.classification,
-        reason=parsed.reason,
-        confidence=float(parsed.confidence),
-        task_title=parsed.task_title,
-        task_due=task_due.isoformat() if task_due else None,
-        task_priority=parsed.task_priority,
-        task_description=parsed.task_description,
-        event_title=parsed.event_title,
-        event_start=event_start.isoformat() if event_start else None,
-        event_end=event_end.isoformat() if event_end else None,
-        event_location=parsed.event_location,
+    # parsed is already validated; copy it rather than re-running validation on every field.
+    return parsed.model_copy(
+        update={
+            "task_due": task_due.isoformat() if task_due else None,
+            "event_start": event_start.isoformat() if event_start else None,
+            "event_end": event_end.isoformat() if event_end else None,
+        }
     )
 
 
 def parse_assistant_action_openai(text: str, base_dt: datetime) -> AssistantActionOutput:
-    system_prompt = (
-        "You are an assistant action parser for a work planner."
-        " Return strict JSON only with fields: "
-        "intent(create_task|create_event|update_task|delete_task|start_task|reschedule_request|complete_task|"
-        "update_priority|list_tasks|list_events|find_free_time|move_event|register_meeting_note|unknown), "
-        "title, due, effort_minutes, priority, meeting_note, note. "
-        "For meeting-note style text, use register_meeting_note and copy full note text into meeting_note."
-        " For task completion/priority update, title should be the target task title or keyword."
-        " For schedule/meeting add requests, use create_event."
-        " For create_event/create_task, title must be a concise semantic subject"
-        " (exclude date/time text and command words)."
-        " If only generic title words are available, keep them as-is and do not hallucinate."
-        " Use null for unknown values."
-        " due should be ISO-8601 datetime when possible."
-    )
-
     user_prompt = (
         f"timezone={settings.timezone}\n"
-        f"base_datetime={base_dt.isoformat()}\n"
+        f"base_datetime={_prompt_datetime(base_dt)}\n"
         f"user_message={text}"
     )
 
-    payload = _chat_json(
-        system_prompt,
+    content = _chat_json(
+        _ASSISTANT_ACTION_SYSTEM_PROMPT,
         user_prompt,
         purpose="assistant",
         temperature=settings.openai_assistant_temperature,
     )
-    try:
-        parsed = AssistantActionOutput.model_validate(payload)
-    except ValidationError as exc:
-        raise OpenAIIntegrationError(f"OpenAI assistant action schema validation failed: {exc}") from exc
+    parsed = _parse_output(AssistantActionOutput, content, "assistant action")
 
     return parsed
 
@@ -934,75 +1316,28 @@ def parse_assistant_plan_openai(
             )
         )
 
-    system_prompt = (
-        "You are an action planner for a Korean/English work assistant."
-        " Return strict JSON only with shape:"
-        ' {"actions":[{"intent":string,"title":string|null,"task_keyword":string|null,"due":string|null,'
-        '"cutoff_hour":int|null,"effort_minutes":int|null,"priority":string|null,"status":string|null,'
-        '"meeting_note":string|null,"reschedule_hint":string|null,"new_title":string|null,'
-        '"start":string|null,"end":string|null,"duration_minutes":int|null,'
-        '"description":string|null,"target_date":string|null,"limit":int|null}],'
-        '"note":string|null}.'
-        " Supported intent values are:"
-        " create_task, create_event, update_task, delete_task, start_task, reschedule_request, reschedule_after_hour,"
-        " complete_task, update_priority, update_due, list_tasks, list_events, find_free_time, move_event,"
-        " delete_duplicate_tasks, delete_duplicate_events, register_meeting_note, delete_event, update_event, unknown."
-        " Parse multiple requests in one message into multiple actions in order."
-        " CRITICAL: if user asks to add schedule/meeting/calendar event (일정/미팅/회의/캘린더 + 추가/등록/잡아줘),"
-        " you MUST output create_event, not create_task."
-        " Use create_task only when user explicitly asks for to-do/task/할일."
-        " For create_event/create_task, title must be a concise semantic subject, not the whole sentence."
-        " Remove date/time words and command words from title."
-        " Example: '이번주 목요일 오후3시에 공인알림 미팅 일정 추가' => title='공인알림 미팅'."
-        " If you only know a generic title (미팅/회의/일정/task), keep it generic; do not invent details."
-        " For update_task, put changed fields into priority/status/due/description/effort_minutes/new_title."
-        " For move_event, set task_keyword to existing event title and set start (and optionally end or duration_minutes)."
-        " If the user changes an existing event's date/time, you MUST output move_event, not update_event."
-        " Use update_event only when the event title/details/duration are being edited."
-        " If user asks to extend/shorten an existing event, keep intent=update_event and set duration_minutes or end."
-        " For list_events/list_tasks/find_free_time, use target_date/limit/duration_minutes when inferable."
-        " If user asks to show/list tasks, MUST output list_tasks."
-        " If user asks to show/list schedule/calendar/events, MUST output list_events."
-        " If user asks for available/free time slots, MUST output find_free_time."
-        " For complete/update actions, choose task_keyword from existing task titles and make it specific."
-        " For delete_event or update_event, choose task_keyword from existing event titles when possible."
-        " For update_event, set new_title when user asks to rename the event."
-        " If user message is approval intent and contains approval id, still return unknown and ask a Korean clarification"
-        " question in note only when target approval cannot be inferred."
-        " Never use a generic one-word keyword like '작업', '고객', '미팅'."
-        " For requests like 'after 6pm' or '오후 6시 이후', use reschedule_after_hour and set cutoff_hour."
-        " For duplicate task cleanup requests, use delete_duplicate_tasks."
-        " For duplicate event cleanup requests, use delete_duplicate_events."
-        " If matching is uncertain, keep intent as unknown and set note as one concise clarification question in Korean."
-        " due should be ISO-8601 datetime when inferable, else null."
-        " If message is meeting notes/transcript, use register_meeting_note with full note in meeting_note."
-        " For meeting-note messages, do not generate extra create_task actions."
-        " Resolve references like '그거/방금 거/that one' using recent conversation when possible."
-        " Do not answer user-facing content in note."
-        " note is only for one short clarification question when all actions are unknown."
-        " Prefer executable actions over unknown when evidence exists in contexts."
-        " Keep actions concise and executable."
-    )
-
-    user_prompt = (
-        f"timezone={settings.timezone}\n"
-        f"base_datetime={base_dt.isoformat()}\n"
-        f"recent_conversation:\n{'\n'.join(history_lines) if history_lines else '(none)'}\n"
-        f"existing_tasks:\n{'\n'.join(context_lines)}\n"
-        f"existing_events:\n{'\n'.join(event_lines) if event_lines else '(none)'}\n"
-        f"pending_approvals:\n{'\n'.join(approval_lines) if approval_lines else '(none)'}\n"
-        f"user_message={text}"
+    user_prompt = "\n".join(
+        [
+            f"timezone={settings.timezone}",
+            "existing_tasks:",
+            *(context_lines or [""]),
+            "existing_events:",
+            *(event_lines or ["(none)"]),
+            "pending_approvals:",
+            *(approval_lines or ["(none)"]),
+            "recent_conversation:",
+            *(history_lines or ["(none)"]),
+            f"base_datetime={_prompt_datetime(base_dt)}",
+            f"user_message={text}",
+        ]
     )
 
-    payload = _chat_json(
-        system_prompt,
+    content = _chat_json(
+        _ASSISTANT_PLAN_SYSTEM_PROMPT,
         user_prompt,
         purpose="assistant",
         temperature=settings.openai_assistant_temperature,
     )
-    try:
-        parsed = AssistantPlanOutput.model_validate(payload)
-    except ValidationError as exc:
-        raise OpenAIIntegrationError(f"OpenAI assistant plan schema validation failed: {exc}") from exc
+    parsed = _parse_output(AssistantPlanOutput, content, "assistant plan")
 
     return parsed
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import math
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 import logging
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import and_, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, insert, lambda_stmt, or_, select
+from sqlalchemy.orm import Session, selectinload
 
 from app.config import settings
 from app.models import CalendarBlock, SchedulingChange, SchedulingProposal, Task, UserProfile
@@ -20,6 +24,7 @@ except Exception:  # noqa: BLE001
 
 DAY_KEYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
 PRIORITY_SCORE = {"critical": 4, "high": 3, "medium": 2, "low": 1}
+MORNING_MEETING_BONUS = 600
 CP_SAT_STATUSES = {
     0: "unknown",
     1: "model_invalid",
@@ -31,16 +36,56 @@ CP_SAT_STATUSES = {
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Interval:
     start: datetime
     end: datetime
+    # Cached once: aware timestamp() resolves the UTC offset on every call.
+    start_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.start_ts = self.start.timestamp()
 
     @property
     def minutes(self) -> int:
         return int((self.end - self.start).total_seconds() // 60)
 
 
+# Detached task snapshot for the allocators; due is normalized to naive UTC once.
+@dataclass(slots=True)
+class TaskView:
+    id: str
+    title: str
+    priority: str
+    effort_minutes: int
+    due: datetime | None
+    due_naive: datetime | None
+    due_ts: float
+    # Precomputed ascending sort keys for _task_order.
+    priority_key: int
+    effort_key: int
+
+
+def _task_view(task: Task) -> TaskView:
+    due_naive = _as_naive_utc(task.due) if task.due else None
+    return TaskView(
+        id=task.id,
+        title=task.title,
+        priority=task.priority,
+        effort_minutes=task.effort_minutes,
+        due=task.due,
+        due_naive=due_naive,
+        due_ts=due_naive.timestamp() if due_naive else float("inf"),
+        priority_key=-PRIORITY_SCORE[task.priority],
+        effort_key=-max(task.effort_minutes, 30),
+    )
+
+
+# (start, end) as naive UTC plus the task's naive UTC due, kept beside each change
+# payload so scoring does not re-parse the ISO strings.
+ChangeMetric = tuple[datetime, datetime, datetime | None]
+
+
 def _coerce_timezone(dt: datetime, tz: ZoneInfo) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=tz)
@@ -53,6 +98,12 @@ def _as_naive_utc(dt: datetime) -> datetime:
     return dt.astimezone(timezone.utc).replace(tzinfo=None)
 
 
+@lru_cache(maxsize=32)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=512)
 def _parse_hhmm(value: str) -> time:
     hour, minute = value.split(":")
     return time(hour=int(hour), minute=int(minute))
@@ -61,14 +112,21 @@ def _parse_hhmm(value: str) -> time:
 def _merge_intervals(intervals: list[Interval]) -> list[Interval]:
     if not intervals:
         return []
-    ordered = sorted(intervals, key=lambda item: item.start)
-    merged = [ordered[0]]
-    for interval in ordered[1:]:
-        prev = merged[-1]
-        if interval.start <= prev.end:
-            prev.end = max(prev.end, interval.end)
+    ordered = sorted(intervals, key=attrgetter("start"))
+    current = ordered[0]
+    current_end = current.end
+    merged = [current]
+    # Track the running end in a local and write it back once per merged run.
+    for interval in islice(ordered, 1, None):
+        if interval.start <= current_end:
+            if interval.end > current_end:
+                current_end = interval.end
         else:
+            current.end = current_end
+            current = interval
+            current_end = interval.end
             merged.append(interval)
+    current.end = current_end
     return merged
 
 
@@ -78,34 +136,41 @@ def _subtract(base: list[Interval], busy: list[Interval]) -> list[Interval]:
 
     result: list[Interval] = []
     busy_merged = _merge_intervals(busy)
+    busy_starts = [taken.start for taken in busy_merged]
+    busy_ends = [taken.end for taken in busy_merged]
 
+    # Merged busy intervals are sorted and disjoint, so a binary search finds the
+    # only ones overlapping each window and the gaps can be carved in one pass.
+    append = result.append
     for window in base:
-        cursors = [window]
-        for taken in busy_merged:
-            next_cursors: list[Interval] = []
-            for cursor in cursors:
-                if taken.end <= cursor.start or taken.start >= cursor.end:
-                    next_cursors.append(cursor)
-                    continue
-                if taken.start > cursor.start:
-                    next_cursors.append(Interval(cursor.start, min(taken.start, cursor.end)))
-                if taken.end < cursor.end:
-                    next_cursors.append(Interval(max(taken.end, cursor.start), cursor.end))
-            cursors = [c for c in next_cursors if c.end > c.start]
-        result.extend(cursors)
+        window_start = window.start
+        window_end = window.end
+        lo = bisect_right(busy_ends, window_start)
+        hi = bisect_left(busy_starts, window_end)
+        if lo >= hi:
+            if window_end > window_start:
+                append(window)
+            continue
+        cursor = window_start
+        for busy_start, busy_end in zip(busy_starts[lo:hi], busy_ends[lo:hi]):
+            if busy_start > cursor:
+                append(Interval(cursor, busy_start))
+            if busy_end > cursor:
+                cursor = busy_end
+        if cursor < window_end:
+            append(Interval(cursor, window_end))
     return result
 
 
 def _get_work_window_for_day(
     day: date,
-    working_hours: dict,
+    hours_by_day: dict[str, dict],
+    lunch: dict,
     tz: ZoneInfo,
     horizon_start: datetime,
     horizon_end: datetime,
 ) -> list[Interval]:
-    key = DAY_KEYS[day.weekday()]
-    days = working_hours.get("days", [])
-    match = next((item for item in days if item.get("day") == key), None)
+    match = hours_by_day.get(DAY_KEYS[day.weekday()])
     if match is None:
         return []
 
@@ -119,7 +184,6 @@ def _get_work_window_for_day(
 
     work = [Interval(day_start, day_end)]
 
-    lunch = working_hours.get("lunch") or {}
     if lunch.get("start") and lunch.get("end"):
         lunch_start = datetime.combine(day, _parse_hhmm(lunch["start"]), tzinfo=tz)
         lunch_end = datetime.combine(day, _parse_hhmm(lunch["end"]), tzinfo=tz)
@@ -129,19 +193,21 @@ def _get_work_window_for_day(
 
 
 def _fetch_busy_intervals(db: Session, horizon_start: datetime, horizon_end: datetime) -> list[Interval]:
-    stmt = select(CalendarBlock).where(
-        and_(
-            CalendarBlock.start < horizon_end,
-            CalendarBlock.end > horizon_start,
+    # lambda_stmt caches the constructed statement, not just its compiled SQL; only
+    # the two columns used here are fetched, skipping ORM entity hydration.
+    stmt = lambda_stmt(
+        lambda: select(CalendarBlock.start, CalendarBlock.end).where(
+            and_(
+                CalendarBlock.start < horizon_end,
+                CalendarBlock.end > horizon_start,
+            )
         )
     )
-    rows = db.execute(stmt).scalars().all()
+    rows = db.execute(stmt).all()
     ref_tz = horizon_start.tzinfo
 
     intervals: list[Interval] = []
-    for row in rows:
-        start = row.start
-        end = row.end
+    for start, end in rows:
         if ref_tz and start.tzinfo is None:
             start = start.replace(tzinfo=ref_tz)
         if ref_tz and end.tzinfo is None:
@@ -158,33 +224,39 @@ def _free_intervals(
     horizon_end: datetime,
     timezone: str,
 ) -> list[Interval]:
-    tz = ZoneInfo(timezone)
+    tz = _zone(timezone)
     horizon_start = _coerce_timezone(horizon_start, tz)
     horizon_end = _coerce_timezone(horizon_end, tz)
     start_day = horizon_start.astimezone(tz).date()
     end_day = horizon_end.astimezone(tz).date()
 
+    # First entry per weekday wins, as the previous per-day linear scan did.
+    hours_by_day: dict[str, dict] = {}
+    for item in working_hours.get("days", []):
+        hours_by_day.setdefault(item.get("day"), item)
+    lunch = working_hours.get("lunch") or {}
+
     windows: list[Interval] = []
     cursor = start_day
     while cursor <= end_day:
-        windows.extend(_get_work_window_for_day(cursor, working_hours, tz, horizon_start, horizon_end))
+        windows.extend(_get_work_window_for_day(cursor, hours_by_day, lunch, tz, horizon_start, horizon_end))
         cursor += timedelta(days=1)
 
     busy = _fetch_busy_intervals(db, horizon_start, horizon_end)
     return [i for i in _subtract(windows, busy) if i.minutes >= 15]
 
 
-def _task_order(strategy: str, tasks: list[Task]) -> list[Task]:
-    def due_key(task: Task) -> float:
-        if task.due is None:
-            return float("inf")
-        return _as_naive_utc(task.due).timestamp()
+_URGENT_ORDER_KEY = attrgetter("due_ts", "priority_key")
+_FOCUS_ORDER_KEY = attrgetter("effort_key", "priority_key", "due_ts")
+_STABLE_ORDER_KEY = attrgetter("priority_key", "due_ts")
+
 
+def _task_order(strategy: str, tasks: list[TaskView]) -> list[TaskView]:
     if strategy == "urgent":
-        return sorted(tasks, key=lambda t: (due_key(t), -PRIORITY_SCORE[t.priority]))
+        return sorted(tasks, key=_URGENT_ORDER_KEY)
     if strategy == "focus":
-        return sorted(tasks, key=lambda t: (-max(t.effort_minutes, 30), -PRIORITY_SCORE[t.priority], due_key(t)))
-    return sorted(tasks, key=lambda t: (-PRIORITY_SCORE[t.priority], due_key(t)))
+        return sorted(tasks, key=_FOCUS_ORDER_KEY)
+    return sorted(tasks, key=_STABLE_ORDER_KEY)
 
 
 def _deep_windows(profile: UserProfile) -> list[tuple[str, time, time, float]]:
@@ -204,27 +276,51 @@ def _deep_windows(profile: UserProfile) -> list[tuple[str, time, time, float]]:
     return windows
 
 
-def _interval_focus_score(interval: Interval, windows: list[tuple[str, time, time, float]], tz: ZoneInfo) -> float:
-    if not windows:
+def _time_of_day_us(value: time | datetime) -> int:
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
+
+
+def _deep_windows_by_day(windows: list[tuple[str, time, time, float]]) -> dict[str, list[tuple[int, int, float]]]:
+    # Window bounds as microseconds since local midnight, so overlaps are plain integer
+    # arithmetic instead of datetime.combine/timedelta per window per candidate.
+    by_day: dict[str, list[tuple[int, int, float]]] = defaultdict(list)
+    for win_day, win_start, win_end, weight in windows:
+        by_day[win_day].append((_time_of_day_us(win_start), _time_of_day_us(win_end), float(weight)))
+    return dict(by_day)
+
+
+def _local_span_us(local_start: datetime, local_end: datetime) -> tuple[int, int]:
+    # Both ends share the tzinfo, so their difference is wall-clock time like the
+    # window bounds; the end may run past midnight.
+    start_us = _time_of_day_us(local_start)
+    return start_us, start_us + (local_end - local_start) // timedelta(microseconds=1)
+
+
+def _interval_focus_score(
+    interval: Interval,
+    windows_by_day: dict[str, list[tuple[int, int, float]]],
+    tz: ZoneInfo,
+) -> float:
+    if not windows_by_day:
         return 0.0
 
     local_start = _coerce_timezone(interval.start, tz).astimezone(tz)
+    day_windows = windows_by_day.get(DAY_KEYS[local_start.weekday()])
+    if not day_windows:
+        return 0.0
     local_end = _coerce_timezone(interval.end, tz).astimezone(tz)
-    day_key = DAY_KEYS[local_start.weekday()]
+    start_us, end_us = _local_span_us(local_start, local_end)
 
     score = 0.0
-    for win_day, win_start, win_end, weight in windows:
-        if win_day != day_key:
-            continue
-        win_s = datetime.combine(local_start.date(), win_start, tzinfo=tz)
-        win_e = datetime.combine(local_start.date(), win_end, tzinfo=tz)
-        overlap = max(timedelta(0), min(local_end, win_e) - max(local_start, win_s))
-        score += overlap.total_seconds() / 60 * weight
+    for win_start_us, win_end_us, weight in day_windows:
+        overlap = min(end_us, win_end_us) - max(start_us, win_start_us)
+        if overlap > 0:
+            score += overlap / 1_000_000 / 60 * weight
     return score
 
 
-def _task_required_minutes(task: Task, slot_minutes: int) -> int:
-    required = max(slot_minutes, int(math.ceil(task.effort_minutes / slot_minutes) * slot_minutes))
+def _task_required_minutes(task: TaskView, slot_minutes: int) -> int:
+    required = max(slot_minutes, (task.effort_minutes + slot_minutes - 1) // slot_minutes * slot_minutes)
     # 너무 긴 블록은 일정 배치 실패를 늘리므로 MVP에서는 2시간 상한으로 분할.
     return min(required, 2 * 60)
 
@@ -232,22 +328,21 @@ def _task_required_minutes(task: Task, slot_minutes: int) -> int:
 def _deep_overlap_minutes(
     start: datetime,
     end: datetime,
-    windows: list[tuple[str, time, time, float]],
+    windows_by_day: dict[str, list[tuple[int, int, float]]],
     tz: ZoneInfo,
 ) -> int:
-    if not windows:
+    if not windows_by_day:
         return 0
-    day_key = DAY_KEYS[start.astimezone(tz).weekday()]
     local_start = start.astimezone(tz)
-    local_end = end.astimezone(tz)
+    day_windows = windows_by_day.get(DAY_KEYS[local_start.weekday()])
+    if not day_windows:
+        return 0
+    start_us, end_us = _local_span_us(local_start, end.astimezone(tz))
     total = 0.0
-    for win_day, win_start, win_end, weight in windows:
-        if day_key != win_day:
-            continue
-        win_s = datetime.combine(local_start.date(), win_start, tzinfo=tz)
-        win_e = datetime.combine(local_start.date(), win_end, tzinfo=tz)
-        overlap = max(timedelta(0), min(local_end, win_e) - max(local_start, win_s))
-        total += (overlap.total_seconds() / 60.0) * float(weight)
+    for win_start_us, win_end_us, weight in day_windows:
+        overlap = min(end_us, win_end_us) - max(start_us, win_start_us)
+        if overlap > 0:
+            total += (overlap / 1_000_000 / 60.0) * weight
     return int(total)
 
 
@@ -271,7 +366,7 @@ def _meeting_time_score(start: datetime, end: datetime, tz: ZoneInfo, profile: U
 
     if prefer_morning:
         if start_hour <= 12:
-            score += 600
+            score += MORNING_MEETING_BONUS
         else:
             score -= 300
 
@@ -311,11 +406,11 @@ def _slot_segments_from_intervals(
 
 
 def _candidate_score(
-    task: Task,
+    task: TaskView,
     start: datetime,
     end: datetime,
     strategy: str,
-    deep_windows: list[tuple[str, time, time, float]],
+    deep_windows: dict[str, list[tuple[int, int, float]]],
     tz: ZoneInfo,
     horizon_from: datetime,
     profile: UserProfile,
@@ -328,8 +423,8 @@ def _candidate_score(
 
     lateness = 0
     due_urgency_bonus = 0
-    if task.due:
-        due = _as_naive_utc(task.due)
+    if task.due_naive:
+        due = task.due_naive
         end_norm = _as_naive_utc(end)
         start_norm = _as_naive_utc(start)
         lateness = max(0, int((end_norm - due).total_seconds() // 60))
@@ -368,40 +463,46 @@ def _candidate_score(
 
 
 def _allocate_changes_cpsat(
-    tasks: list[Task],
+    tasks: list[TaskView],
     intervals: list[Interval],
     slot_minutes: int,
     strategy: str,
     profile: UserProfile,
     horizon_from: datetime,
     horizon_to: datetime,
-) -> tuple[list[dict], dict]:
+    *,
+    ordered_tasks: list[TaskView] | None = None,
+    required_by_task: dict[str, int] | None = None,
+) -> tuple[list[dict], list[ChangeMetric], dict]:
     if cp_model is None:
-        return [], {"engine": "ortools_cp_sat", "status": "missing_dependency"}
+        return [], [], {"engine": "ortools_cp_sat", "status": "missing_dependency"}
     if not settings.scheduler_cpsat_enabled:
-        return [], {"engine": "ortools_cp_sat", "status": "disabled"}
+        return [], [], {"engine": "ortools_cp_sat", "status": "disabled"}
     if not tasks or not intervals:
-        return [], {"engine": "ortools_cp_sat", "status": "empty_input"}
+        return [], [], {"engine": "ortools_cp_sat", "status": "empty_input"}
 
     slot_minutes = max(15, int(slot_minutes))
     segments = _slot_segments_from_intervals(intervals, horizon_from, slot_minutes)
     if not segments:
-        return [], {"engine": "ortools_cp_sat", "status": "no_free_slots"}
+        return [], [], {"engine": "ortools_cp_sat", "status": "no_free_slots"}
 
-    tz = ZoneInfo(profile.timezone)
-    deep_windows = _deep_windows(profile)
+    tz = _zone(profile.timezone)
+    deep_windows = _deep_windows_by_day(_deep_windows(profile))
     max_candidates = max(20, int(settings.scheduler_cpsat_max_candidates_per_task))
 
     model = cp_model.CpModel()
     slot_to_vars: dict[int, list] = defaultdict(list)
-    task_var_map: dict[str, tuple[Task, list[tuple]]] = {}
+    task_var_map: dict[str, tuple[TaskView, list[tuple]]] = {}
     objective_terms: list = []
 
-    ordered_tasks = _task_order(strategy, tasks)
+    if ordered_tasks is None:
+        ordered_tasks = _task_order(strategy, tasks)
+    if required_by_task is None:
+        required_by_task = {task.id: _task_required_minutes(task, slot_minutes) for task in tasks}
     horizon_slots = int(math.ceil(max(0, (horizon_to - horizon_from).total_seconds() / 60.0) / slot_minutes))
 
     for task_idx, task in enumerate(ordered_tasks):
-        required_minutes = _task_required_minutes(task, slot_minutes)
+        required_minutes = required_by_task[task.id]
         required_slots = max(1, required_minutes // slot_minutes)
         candidates: list[tuple[int, int]] = []
         for seg_start, seg_end in segments:
@@ -442,7 +543,7 @@ def _allocate_changes_cpsat(
         task_var_map[task.id] = (task, vars_for_task)
 
     if not objective_terms:
-        return [], {"engine": "ortools_cp_sat", "status": "no_candidates"}
+        return [], [], {"engine": "ortools_cp_sat", "status": "no_candidates"}
 
     for vars_at_slot in slot_to_vars.values():
         if len(vars_at_slot) > 1:
@@ -459,15 +560,15 @@ def _allocate_changes_cpsat(
     status_name = CP_SAT_STATUSES.get(int(status), "unknown")
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         logger.info("CP-SAT solver did not produce a feasible plan: %s", status_name)
-        return [], {"engine": "ortools_cp_sat", "status": status_name}
+        return [], [], {"engine": "ortools_cp_sat", "status": status_name}
 
-    changes: list[dict] = []
+    placed: list[tuple[dict, ChangeMetric]] = []
     for task_id, (task, vars_for_task) in task_var_map.items():
         chosen = next((item for item in vars_for_task if solver.Value(item[0]) == 1), None)
         if chosen is None:
             continue
         _, _, _, _, start_dt, end_dt, required_minutes = chosen
-        changes.append(
+        change = (
             {
                 "kind": "create_block",
                 "block": {
@@ -481,40 +582,63 @@ def _allocate_changes_cpsat(
                 "task": {"id": task.id, "title": task.title, "due": task.due.isoformat() if task.due else None},
             }
         )
+        placed.append((change, (_as_naive_utc(start_dt), _as_naive_utc(end_dt), task.due_naive)))
 
-    changes.sort(key=lambda item: item["block"]["start"])
-    return changes, {"engine": "ortools_cp_sat", "status": status_name}
+    placed.sort(key=lambda item: item[0]["block"]["start"])
+    changes = [change for change, _ in placed]
+    metrics = [metric for _, metric in placed]
+    return changes, metrics, {"engine": "ortools_cp_sat", "status": status_name}
 
 
 def _pick_interval(
     intervals: list[Interval],
     required_minutes: int,
     strategy: str,
-    due: datetime | None,
-    deep_windows: list[tuple[str, time, time, float]],
+    due_norm: datetime | None,
+    deep_windows: dict[str, list[tuple[int, int, float]]],
     tz: ZoneInfo,
     profile: UserProfile,
+    learning_scores: dict[tuple[datetime, datetime], int],
+    focus_scores: dict[tuple[datetime, datetime], float],
 ) -> int | None:
     best_idx = None
     best_score = None
-    due_norm = _as_naive_utc(due) if due else None
+    # stable/urgent scores never drop below start - max learning bonus, so once the
+    # (start-sorted) intervals pass the best score nothing later can beat it.
+    early_exit = strategy != "focus"
+    max_learning_bonus = MORNING_MEETING_BONUS if _meeting_preference_flags(profile)[0] else 0
+    # Equivalent to interval.minutes < required_minutes without the property call.
+    required_span = timedelta(minutes=required_minutes)
+    get_learning = learning_scores.get
+    get_focus = focus_scores.get
 
     for idx, interval in enumerate(intervals):
-        if interval.minutes < required_minutes:
+        start_ts = interval.start_ts
+        if early_exit and best_score is not None and start_ts - max_learning_bonus >= best_score:
+            break
+        start = interval.start
+        end = interval.end
+        if end - start < required_span:
             continue
-        learning_score = _meeting_time_score(interval.start, interval.end, tz, profile)
+        # Interval-only terms are shared by every task and strategy in one run.
+        key = (start, end)
+        learning_score = get_learning(key)
+        if learning_score is None:
+            learning_score = learning_scores[key] = _meeting_time_score(start, end, tz, profile)
 
         if strategy == "stable":
-            score = interval.start.timestamp() - learning_score
+            score = start_ts - learning_score
         elif strategy == "urgent":
             lateness_penalty = 0.0
-            interval_end_norm = _as_naive_utc(interval.end)
+            interval_end_norm = _as_naive_utc(end)
             if due_norm and interval_end_norm > due_norm:
                 lateness_penalty = (interval_end_norm - due_norm).total_seconds() / 60 * 5.0
-            score = interval.start.timestamp() + lateness_penalty - learning_score
+            score = start_ts + lateness_penalty - learning_score
         else:
-            focus_bonus = _interval_focus_score(interval, deep_windows, tz)
-            score = interval.start.timestamp() - focus_bonus * 60 - learning_score
+            focus_bonus = get_focus(key)
+            if focus_bonus is None:
+                focus_bonus = focus_scores[key] = _interval_focus_score(interval, deep_windows, tz)
+            score = start_ts - focus_bonus * 60 - learning_score
 
         if best_score is None or score < best_score:
             best_idx = idx
@@ -524,25 +648,51 @@ def _pick_interval(
 
 
 def _allocate_changes(
-    tasks: list[Task],
+    tasks: list[TaskView],
     intervals: list[Interval],
     slot_minutes: int,
     strategy: str,
     profile: UserProfile,
-) -> list[dict]:
+    *,
+    ordered_tasks: list[TaskView] | None = None,
+    required_by_task: dict[str, int] | None = None,
+    learning_scores: dict[tuple[datetime, datetime], int] | None = None,
+    focus_scores: dict[tuple[datetime, datetime], float] | None = None,
+) -> tuple[list[dict], list[ChangeMetric]]:
     if not tasks:
-        return []
-
-    available = [Interval(i.start, i.end) for i in intervals]
-    tz = ZoneInfo(profile.timezone)
-    deep_windows = _deep_windows(profile)
+        return [], []
+    if ordered_tasks is None:
+        ordered_tasks = _task_order(strategy, tasks)
+    if required_by_task is None:
+        required_by_task = {task.id: _task_required_minutes(task, slot_minutes) for task in tasks}
+    if learning_scores is None:
+        learning_scores = {}
+    if focus_scores is None:
+        focus_scores = {}
+
+    # Shallow copy: picks replace entries with new Interval objects and never
+    # mutate the shared free intervals, so every strategy can start from them.
+    available = sorted(intervals, key=lambda item: item.start)
+    tz = _zone(profile.timezone)
+    deep_windows = _deep_windows_by_day(_deep_windows(profile))
 
     changes: list[dict] = []
-
-    for task in _task_order(strategy, tasks):
-        required = _task_required_minutes(task, slot_minutes)
-
-        picked = _pick_interval(available, required, strategy, task.due, deep_windows, tz, profile)
+    metrics: list[ChangeMetric] = []
+
+    for task in ordered_tasks:
+        required = required_by_task[task.id]
+
+        picked = _pick_interval(
+            available,
+            required,
+            strategy,
+            task.due_naive,
+            deep_windows,
+            tz,
+            profile,
+            learning_scores,
+            focus_scores,
+        )
         if picked is None:
             continue
 
@@ -564,13 +714,14 @@ def _allocate_changes(
                 "task": {"id": task.id, "title": task.title, "due": task.due.isoformat() if task.due else None},
             }
         )
+        metrics.append((_as_naive_utc(start), _as_naive_utc(end), task.due_naive))
 
         if end >= chosen.end:
             del available[picked]
         else:
             available[picked] = Interval(end, chosen.end)
 
-    return changes
+    return changes, metrics
 
 
 def _proposal_summary(strategy: str, *, engine: str) -> str:
@@ -633,25 +784,24 @@ def _changes_signature(changes: list[dict]) -> tuple[tuple[str, str, str], ...]:
     return tuple(sorted(parts))
 
 
-def _score(changes: list[dict], tasks_by_id: dict[str, Task]) -> dict:
+def _note_duplicate_strategy(proposal: SchedulingProposal, strategy: str) -> None:
+    # Reassign rather than mutate so the JSON column is flagged dirty.
+    explanation = dict(proposal.explanation or {})
+    explanation["notes"] = f"{explanation.get('notes', '')} · 동일 배치 전략={strategy}"
+    proposal.explanation = explanation
+
+
+def _score(changes: list[dict], metrics: list[ChangeMetric]) -> dict:
     lateness = 0
     deep_work = 0
 
-    for change in changes:
-        block = change["block"]
-        start = datetime.fromisoformat(block["start"])
-        end = datetime.fromisoformat(block["end"])
-        duration = int((end - start).total_seconds() // 60)
+    for start_norm, end_norm, due in metrics:
+        duration = int((end_norm - start_norm).total_seconds() // 60)
         if duration >= 90:
             deep_work += duration
 
-        task_id = block.get("task_id")
-        task = tasks_by_id.get(task_id)
-        if task and task.due:
-            due = _as_naive_utc(task.due)
-            end_norm = _as_naive_utc(end)
-            if end_norm > due:
-                lateness += int((end_norm - due).total_seconds() // 60)
+        if due and end_norm > due:
+            lateness += int((end_norm - due).total_seconds() // 60)
 
     return {
         "objective_value": round(max(0, 1000 - lateness - len(changes) * 10 + deep_work * 0.5), 2),
@@ -661,6 +811,14 @@ def _score(changes: list[dict], tasks_by_id: dict[str, Task]) -> dict:
     }
 
 
+def _insert_changes(db: Session, proposal: SchedulingProposal, changes: list[dict]) -> None:
+    # One executemany INSERT per proposal instead of an ORM unit-of-work row per change.
+    db.execute(
+        insert(SchedulingChange),
+        [{"proposal_id": proposal.id, "kind": change["kind"], "payload": change} for change in changes],
+    )
+
+
 def generate_proposals(
     db: Session,
     profile: UserProfile,
@@ -672,19 +830,20 @@ def generate_proposals(
 ) -> list[SchedulingProposal]:
     # Normalize horizon boundaries to a consistent timezone-aware basis so
     # downstream CP-SAT slot math does not mix naive/aware datetimes.
-    tz = ZoneInfo(profile.timezone)
+    tz = _zone(profile.timezone)
     horizon_from = _coerce_timezone(horizon_from, tz)
     horizon_to = _coerce_timezone(horizon_to, tz)
     if horizon_to <= horizon_from:
         return []
 
-    task_stmt = select(Task).where(Task.status.in_(["todo", "in_progress"]))
+    task_stmt = lambda_stmt(lambda: select(Task).where(Task.status.in_(["todo", "in_progress"])))
     if task_ids:
-        task_stmt = task_stmt.where(Task.id.in_(task_ids))
+        task_stmt += lambda stmt: stmt.where(Task.id.in_(task_ids))
     else:
-        task_stmt = task_stmt.where(or_(Task.due.is_(None), Task.due <= horizon_to + timedelta(days=7)))
+        due_cutoff = horizon_to + timedelta(days=7)
+        task_stmt += lambda stmt: stmt.where(or_(Task.due.is_(None), Task.due <= due_cutoff))
 
-    tasks = db.execute(task_stmt).scalars().all()
+    tasks = [_task_view(task) for task in db.execute(task_stmt).scalars().all()]
 
     if not tasks:
         return []
@@ -695,15 +854,17 @@ def generate_proposals(
 
     strategies = ["stable", "urgent", "focus"][:max_proposals]
     created: list[SchedulingProposal] = []
-    signatures: set[tuple[tuple[str, str, str], ...]] = set()
+    signatures: dict[tuple[tuple[str, str, str], ...], SchedulingProposal] = {}
 
-    tasks_by_id = {task.id: task for task in tasks}
+    # Both engines walk the same strategies over the same tasks; order and size them once.
+    task_orders = {strategy: _task_order(strategy, tasks) for strategy in strategies}
+    required_by_task = {task.id: _task_required_minutes(task, slot_minutes) for task in tasks}
 
     if cp_model is not None and settings.scheduler_cpsat_enabled:
         for strategy in strategies:
             if len(created) >= max_proposals:
                 break
-            changes_payload, meta = _allocate_changes_cpsat(
+            changes_payload, metrics, meta = _allocate_changes_cpsat(
                 tasks,
                 intervals,
                 slot_minutes,
@@ -711,61 +872,81 @@ def generate_proposals(
                 profile,
                 horizon_from,
                 horizon_to,
+                ordered_tasks=task_orders[strategy],
+                required_by_task=required_by_task,
             )
             if not changes_payload:
                 continue
 
             signature = _changes_signature(changes_payload)
             if signature in signatures:
+                _note_duplicate_strategy(signatures[signature], strategy)
                 continue
-            signatures.add(signature)
 
             proposal = SchedulingProposal(
                 summary=_proposal_summary(strategy, engine="ortools_cp_sat"),
                 explanation=_proposal_explanation(strategy, engine="ortools_cp_sat", profile=profile, meta=meta),
-                score={**_score(changes_payload, tasks_by_id), "engine": "ortools_cp_sat"},
+                score={**_score(changes_payload, metrics), "engine": "ortools_cp_sat"},
                 horizon_from=horizon_from,
                 horizon_to=horizon_to,
                 status="draft",
             )
             db.add(proposal)
             db.flush()
-            for change in changes_payload:
-                db.add(SchedulingChange(proposal_id=proposal.id, kind=change["kind"], payload=change))
+            _insert_changes(db, proposal, changes_payload)
+            signatures[signature] = proposal
             created.append(proposal)
 
+    learning_scores: dict[tuple[datetime, datetime], int] = {}
+    focus_scores: dict[tuple[datetime, datetime], float] = {}
     for strategy in strategies:
         if len(created) >= max_proposals:
             break
-        changes_payload = _allocate_changes(tasks, intervals, slot_minutes, strategy, profile)
+        changes_payload, metrics = _allocate_changes(
+            tasks,
+            intervals,
+            slot_minutes,
+            strategy,
+            profile,
+            ordered_tasks=task_orders[strategy],
+            required_by_task=required_by_task,
+            learning_scores=learning_scores,
+            focus_scores=focus_scores,
+        )
         if not changes_payload:
             continue
 
         signature = _changes_signature(changes_payload)
         if signature in signatures:
+            _note_duplicate_strategy(signatures[signature], strategy)
             continue
-        signatures.add(signature)
 
         proposal = SchedulingProposal(
             summary=_proposal_summary(strategy, engine="heuristic"),
             explanation=_proposal_explanation(strategy, engine="heuristic", profile=profile),
-            score={**_score(changes_payload, tasks_by_id), "engine": "heuristic"},
+            score={**_score(changes_payload, metrics), "engine": "heuristic"},
             horizon_from=horizon_from,
             horizon_to=horizon_to,
             status="draft",
         )
         db.add(proposal)
         db.flush()
-
-        for change in changes_payload:
-            db.add(SchedulingChange(proposal_id=proposal.id, kind=change["kind"], payload=change))
+        _insert_changes(db, proposal, changes_payload)
+        signatures[signature] = proposal
 
         created.append(proposal)
 
     db.commit()
 
-    for proposal in created:
-        db.refresh(proposal)
+    if created:
+        # Reload every proposal with its changes in two queries instead of a refresh
+        # plus a lazy changes load per proposal.
+        db.execute(
+            select(SchedulingProposal)
+            .options(selectinload(SchedulingProposal.changes))
+            .where(SchedulingProposal.id.in_([proposal.id for proposal in created]))
+            .execution_options(populate_existing=True)
+        ).scalars().all()
 
     return created
 
@@ -811,6 +992,7 @@ def apply_proposal(db: Session, proposal: SchedulingProposal) -> tuple[list[Cale
     }
     placed_ranges: list[tuple[datetime, datetime]] = []
 
+    planned: list[tuple[dict, datetime, datetime]] = []
     for change in proposal.changes:
         payload = change.payload
         kind = payload.get("kind")
@@ -823,7 +1005,32 @@ def apply_proposal(db: Session, proposal: SchedulingProposal) -> tuple[list[Cale
         end = _as_naive_utc(datetime.fromisoformat(block["end"]))
         if end <= start:
             continue
+        planned.append((block, start, end))
+
+    # One range query replaces a per-change overlap lookup. Rows added below are
+    # not flushed, so the query never saw them anyway; placed_ranges covers those.
+    existing_starts: list[datetime] = []
+    existing_max_ends: list[datetime] = []
+    if planned:
+        overlap_stmt = select(CalendarBlock.start, CalendarBlock.end).where(
+            and_(
+                CalendarBlock.start < max(end for _, _, end in planned),
+                CalendarBlock.end > min(start for _, start, _ in planned),
+            )
+        )
+        if reusable_ids_all:
+            overlap_stmt = overlap_stmt.where(CalendarBlock.id.notin_(list(reusable_ids_all)))
+        existing = sorted(
+            (_as_naive_utc(row_start), _as_naive_utc(row_end))
+            for row_start, row_end in db.execute(overlap_stmt).all()
+        )
+        max_end: datetime | None = None
+        for row_start, row_end in existing:
+            max_end = row_end if max_end is None else max(max_end, row_end)
+            existing_starts.append(row_start)
+            existing_max_ends.append(max_end)
 
+    for block, start, end in planned:
         task_id = block.get("task_id")
         reusable = None
         if task_id:
@@ -835,16 +1042,9 @@ def apply_proposal(db: Session, proposal: SchedulingProposal) -> tuple[list[Cale
         if any(start < placed_end and end > placed_start for placed_start, placed_end in placed_ranges):
             continue
 
-        overlap_stmt = select(CalendarBlock).where(
-            and_(
-                CalendarBlock.start < end,
-                CalendarBlock.end > start,
-            )
-        )
-        if reusable_ids_all:
-            overlap_stmt = overlap_stmt.where(CalendarBlock.id.notin_(list(reusable_ids_all)))
-        overlap = db.execute(overlap_stmt).scalars().first()
-        if overlap:
+        # Blocks starting before `end` overlap iff the latest end among them is after `start`.
+        idx = bisect_left(existing_starts, end)
+        if idx and existing_max_ends[idx - 1] > start:
             continue
 
         if reusable:
@@ -869,17 +1069,20 @@ def apply_proposal(db: Session, proposal: SchedulingProposal) -> tuple[list[Cale
                 locked=bool(block.get("locked", False)),
                 source="aawo",
             )
-            db.add(row)
             created_blocks.append(row)
             placed_ranges.append((start, end))
 
+    db.add_all(created_blocks)
     proposal.status = "applied"
     db.commit()
 
-    for row in created_blocks:
-        db.refresh(row)
-    for row in updated_blocks:
-        db.refresh(row)
+    touched_ids = [row.id for row in created_blocks] + [row.id for row in updated_blocks]
+    if touched_ids:
+        db.execute(
+            select(CalendarBlock)
+            .where(CalendarBlock.id.in_(touched_ids))
+            .execution_options(populate_existing=True)
+        ).scalars().all()
     db.refresh(proposal)
 
     return created_blocks, updated_blocks
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import random
 import sys
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 
+import httpx
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from app.routers.assistant import _fallback_classify, _quick_plan_actions
+from app.services import graph_service
+from app.services.openai_client import _budget_transcript_lines, _estimate_tokens, _run_hedged, _try_local_nli
+from app.services.scheduler import Interval, _merge_intervals, _subtract
 
 
 CASES = [
@@ -31,6 +40,144 @@ CASES = [
     ("오후 6시 이후 일정들 모두 재배치해줘", "reschedule_after_hour"),
 ]
 
+# Local NLI fast path: None means the command must be left to the model.
+NLI_CASES = [
+    ("중복된 미팅 삭제", "delete_duplicate_events"),
+    ("중복 일정 정리해줘", "delete_duplicate_events"),
+    ("중복 할 일 삭제", "delete_duplicate_tasks"),
+    ("오후 6시 이후 일정들 모두 재배치해줘", "reschedule_after_hour"),
+    ("중복 일정은 삭제하지 마", None),
+    ("회의를 오후 3시 이후로 옮겨줘", None),
+    ("오후 6시 넘어 끝나는 회의 하나만 옮겨줘", None),
+    ("move my 3pm meeting to after 5pm", None),
+    ("오늘 3시 미팅 추가", None),
+]
+
+
+def _hedge_failures() -> list[str]:
+    failures: list[str] = []
+
+    def stuck_primary(model: str, cancelled: threading.Event | None) -> str:
+        if model == "primary":
+            time.sleep(1.0)
+        return model
+
+    started = time.monotonic()
+    result = _run_hedged(stuck_primary, "primary", "backup", 0.05, started + 2.0)
+    elapsed = time.monotonic() - started
+    if result != "backup" or elapsed > 0.5:
+        failures.append(f"hedge: stuck primary returned {result!r} after {elapsed:.2f}s")
+
+    def failing_primary(model: str, cancelled: threading.Event | None) -> str:
+        if model == "primary":
+            raise ValueError("bad reply")
+        return model
+
+    result = _run_hedged(failing_primary, "primary", "backup", 5.0, time.monotonic() + 2.0)
+    if result != "backup":
+        failures.append(f"hedge: failed primary returned {result!r}")
+
+    started = time.monotonic()
+    try:
+        _run_hedged(stuck_primary, "primary", "primary", 0.05, started + 0.2)
+        failures.append("hedge: expected TimeoutError past the total wait budget")
+    except TimeoutError:
+        if time.monotonic() - started > 0.5:
+            failures.append("hedge: total wait budget not enforced")
+    return failures
+
+
+def _transcript_budget_failures() -> list[str]:
+    failures: list[str] = []
+    pasted_note = [{"speaker": "민수", "text": "회의록 " * 5000 + "금요일까지 보고서 작성"}]
+    lines = _budget_transcript_lines(pasted_note, 500)
+    if not lines or not lines[-1].endswith("금요일까지 보고서 작성"):
+        failures.append(f"transcript: long final utterance not clipped: {[line[-40:] for line in lines]}")
+    elif sum(_estimate_tokens(line) for line in lines) > 510:
+        failures.append("transcript: clipped utterance exceeds the budget")
+
+    short = [{"speaker": "a", "text": "첫 번째"}, {"speaker": "b", "text": "두 번째"}]
+    if _budget_transcript_lines(short, 500) != ["- a: 첫 번째", "- b: 두 번째"]:
+        failures.append("transcript: short transcript altered")
+    return failures
+
+
+def _linear_subtract(base: list[Interval], busy: list[Interval]) -> list[Interval]:
+    # Reference: the original per-window scan over every merged busy interval.
+    if not busy:
+        return base
+    result: list[Interval] = []
+    busy_merged = _merge_intervals([Interval(item.start, item.end) for item in busy])
+    for window in base:
+        cursors = [window]
+        for taken in busy_merged:
+            next_cursors: list[Interval] = []
+            for cursor in cursors:
+                if taken.end <= cursor.start or taken.start >= cursor.end:
+                    next_cursors.append(cursor)
+                    continue
+                if taken.start > cursor.start:
+                    next_cursors.append(Interval(cursor.start, min(taken.start, cursor.end)))
+                if taken.end < cursor.end:
+                    next_cursors.append(Interval(max(taken.end, cursor.start), cursor.end))
+            cursors = [c for c in next_cursors if c.end > c.start]
+        result.extend(cursors)
+    return result
+
+
+def _subtract_failures() -> list[str]:
+    rng = random.Random(20260302)
+    origin = datetime(2026, 3, 2)
+
+    def random_intervals(count: int, max_minutes: int) -> list[Interval]:
+        items = []
+        for _ in range(count):
+            start = origin + timedelta(minutes=rng.randrange(0, 7 * 24 * 60, 15))
+            items.append(Interval(start, start + timedelta(minutes=rng.randrange(0, max_minutes, 15))))
+        return items
+
+    for case in range(300):
+        base = sorted(random_intervals(rng.randrange(1, 12), 9 * 60), key=lambda item: item.start)
+        busy = random_intervals(rng.randrange(0, 25), 4 * 60)
+        expected = [(item.start, item.end) for item in _linear_subtract(base, busy)]
+        actual = [(item.start, item.end) for item in _subtract(base, [Interval(b.start, b.end) for b in busy])]
+        if actual != expected:
+            return [f"_subtract case {case}: expected={expected} actual={actual}"]
+    return []
+
+
+def _graph_batch_failures() -> list[str]:
+    # One transport error must not discard the calls that already succeeded.
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/boom"):
+            raise httpx.ConnectError("connection reset", request=request)
+        return httpx.Response(201, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    patched = {
+        "_graph_http_client": lambda: client,
+        "_acquire_access_token": lambda db, **kwargs: "token",
+        "_update_sync_status": lambda *args, **kwargs: None,
+    }
+    originals = {name: getattr(graph_service, name) for name in patched}
+    try:
+        for name, value in patched.items():
+            setattr(graph_service, name, value)
+        results = graph_service._graph_request_many(
+            None, [("POST", "/me/a", {}), ("POST", "/me/boom", {}), ("POST", "/me/c", {})]
+        )
+    finally:
+        for name, value in originals.items():
+            setattr(graph_service, name, value)
+        client.close()
+
+    ok = (
+        results[0] == {"id": "a"}
+        and isinstance(results[1], graph_service.GraphApiError)
+        and results[2] == {"id": "c"}
+    )
+    return [] if ok else [f"graph batch: unexpected results {results}"]
+
 
 def main() -> int:
     failures: list[str] = []
@@ -41,13 +188,24 @@ def main() -> int:
         if actual != expected:
             failures.append(f"{text!r}: expected={expected} actual={actual} payload={parsed}")
 
+    for text, expected in NLI_CASES:
+        local = _try_local_nli(text)
+        actual = local.intent if local is not None else None
+        if actual != expected:
+            failures.append(f"{text!r}: local NLI expected={expected} actual={actual} payload={local}")
+
+    failures.extend(_hedge_failures())
+    failures.extend(_transcript_budget_failures())
+    failures.extend(_subtract_failures())
+    failures.extend(_graph_batch_failures())
+
     if failures:
         print("FAILED")
         for failure in failures:
             print(f"- {failure}")
         return 1
 
-    print(f"OK {len(CASES)} cases")
+    print(f"OK {len(CASES) + len(NLI_CASES)} cases")
     return 0
 
 